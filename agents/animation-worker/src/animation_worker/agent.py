@@ -9,19 +9,150 @@ This agent creates Roblox animations by:
 5. Exporting to Roblox format
 """
 
-import sys
+import asyncio
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
-from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
+from typing import TYPE_CHECKING
 
 from .models import AnimationPhase, AnimationWorkerConfig, LogLevel, NotificationType
 from .status_manager import AnimationStatusManager
 
-# Add the animation tools to the path
-ANIMATION_TOOLS_PATH = Path(__file__).parent.parent.parent.parent.parent / "apps/roblox-animation/src"
-if str(ANIMATION_TOOLS_PATH) not in sys.path:
-    sys.path.insert(0, str(ANIMATION_TOOLS_PATH))
+if TYPE_CHECKING:
+    from animation_tools import AnimationAnalysisResult, BlenderSession
+    from google.genai import types
+    from worker_shared import GitHubOperations
+
+
+def _section_re(*headings: str) -> re.Pattern[str]:
+    """Match the first line containing any of headings, capturing the lines after it
+    up to the next line starting with "## " (### subsections are included)."""
+    alternatives = "|".join(re.escape(heading) for heading in headings)
+    return re.compile(rf"^.*(?:{alternatives}).*$\n?((?:(?!## ).*(?:\n|$))*)", re.MULTILINE)
+
+
+# Issue body sections read by _get_animation_requirements
+_PROMPT_SECTION_RE = _section_re("## Animation Description", "## Prompt")
+_QUALITY_SECTION_RE = _section_re("## Quality Requirements")
+
+# Threads loading rendered frames for Gemini while Blender is still rendering
+FRAME_LOADER_WORKERS = 2
+
+# anim2rbx needs this on DYLD_LIBRARY_PATH to find assimp
+ANIM2RBX_LIBRARY_PATH = "/usr/local/opt/assimp@5/lib"
+
+# Give up once the quality score moves by no more than PLATEAU_SCORE_DELTA between two
+# analyzed iterations with identical suggestions (checked from PLATEAU_MIN_ITERATIONS on)
+PLATEAU_MIN_ITERATIONS = 3
+PLATEAU_SCORE_DELTA = 1
+
+# Prompt for Claude to generate Blender animation code
+CODE_GENERATION_PROMPT = """Generate Blender Python code to create this animation:
+
+## Animation Request
+{prompt}
+
+## Previous Feedback (if any)
+{feedback_text}
+
+## Requirements
+- Use Blender's Python API (bpy)
+- Animation should be {duration} seconds at {fps} fps
+- Total frames: {total_frames}
+- Create smooth, appealing movement suitable for Roblox
+- Use keyframe animation
+- Include proper lighting and camera setup
+- Output ONLY the Python code, no explanations
+
+## Code Structure
+The code will be inserted into a template that:
+- Clears the scene
+- Sets up fps and frame range
+- Saves the .blend file
+
+Your code should:
+1. Create the objects/armature needed
+2. Set up animation keyframes
+3. Add lighting
+4. Position camera
+
+Output only valid Python code that uses bpy."""
+
+# Matches ```python / ```py / bare ``` fenced code blocks in Claude's response
+_CODE_FENCE_RE = re.compile(r"```(?:python|py)?[ \t]*\r?\n(.*?)```", re.DOTALL | re.IGNORECASE)
+
+# Claude usually answers with code in its first turn; the larger budget is only
+# used to retry when no code could be extracted from the first attempt
+CODE_GENERATION_MAX_TURNS = (3, 10)
+
+
+def _normalize_feedback(feedback: list[str]) -> tuple[str, ...]:
+    """Order- and case-insensitive form of Gemini feedback, for detecting repeats."""
+    return tuple(sorted({" ".join(item.lower().split()) for item in feedback} - {""}))
+
+
+def _extract_code(response: str) -> str | None:
+    """Pull Python code out of Claude's response, merging multiple fenced blocks in order."""
+    blocks = [b.strip() for b in _CODE_FENCE_RE.findall(response) if b.strip()]
+    if blocks:
+        return "\n\n".join(blocks)
+
+    # If no code block markers, return as-is if it looks like Python
+    if "import bpy" in response or "bpy." in response:
+        return response.strip()
+
+    return None
+
+
+def _is_plateau(
+    iteration: int,
+    score: int,
+    suggestions: tuple[str, ...],
+    prev_score: int | None,
+    prev_suggestions: tuple[str, ...],
+) -> bool:
+    """Whether an iteration repeated the last one's normalized suggestions without
+    moving the score by more than PLATEAU_SCORE_DELTA."""
+    return (
+        iteration >= PLATEAU_MIN_ITERATIONS
+        and prev_score is not None
+        and abs(score - prev_score) <= PLATEAU_SCORE_DELTA
+        and suggestions == prev_suggestions
+    )
+
+
+def _issue_section(body: str, section_re: re.Pattern[str]) -> str:
+    """Stripped content of the issue body section matched by section_re, or "" if none."""
+    match = section_re.search(body)
+    return match.group(1).strip() if match else ""
+
+
+@dataclass(frozen=True, slots=True)
+class IterationPaths:
+    """Output paths for one iteration, built once and reused (str forms for status/subprocesses)."""
+
+    blend: Path
+    frames_dir: Path
+    fbx: Path
+    rbx: Path
+    blend_str: str
+    frames_str: str
+
+    @classmethod
+    def for_iteration(cls, output_dir: Path, iteration: int) -> "IterationPaths":
+        stem = f"animation_v{iteration}"
+        blend = output_dir / f"{stem}.blend"
+        frames_dir = output_dir / f"frames_v{iteration}"
+        return cls(
+            blend=blend,
+            frames_dir=frames_dir,
+            fbx=output_dir / f"{stem}.fbx",
+            rbx=output_dir / f"{stem}.rbxmx",
+            blend_str=str(blend),
+            frames_str=str(frames_dir),
+        )
 
 
 class AnimationWorkerAgent:
@@ -46,6 +177,32 @@ class AnimationWorkerAgent:
         # Managers will be initialized in run()
         self.status_manager: AnimationStatusManager | None = None
 
+        # GitHub client, created on first use and closed when run() finishes
+        self.github_ops: GitHubOperations | None = None
+
+        # Claude prompt with the per-run constants baked in; only the animation
+        # request and feedback vary between iterations
+        self._total_frames = int(config.fps * config.duration)
+        self._claude_prompt_template = CODE_GENERATION_PROMPT.format(
+            duration=config.duration,
+            fps=config.fps,
+            total_frames=self._total_frames,
+            prompt="{prompt}",
+            feedback_text="{feedback_text}",
+        )
+
+        # Code that built and rendered, keyed by (prompt, normalized feedback), to skip
+        # repeat Claude calls
+        self._code_cache: dict[tuple[str, tuple[str, ...]], str] = {}
+        # Output paths and Gemini analysis of each piece of code built so far
+        self._code_results: dict[str, tuple[IterationPaths, AnimationAnalysisResult]] = {}
+
+        # One Blender process reused for every create/render/export in the run
+        self._blender: BlenderSession | None = None
+
+        # Environment for anim2rbx, copied from ours once rather than per export
+        self._anim2rbx_env = {**os.environ, "DYLD_LIBRARY_PATH": ANIM2RBX_LIBRARY_PATH}
+
     async def run(self) -> bool:
         """
         Run the full animation worker lifecycle.
@@ -63,17 +220,23 @@ class AnimationWorkerAgent:
         )
         await self.status_manager.initialize()
 
+        next_code_task: asyncio.Task[str | None] | None = None
+
         try:
             # Phase 1: Initialize - use per-issue output directory
             await self.status_manager.set_phase(AnimationPhase.INITIALIZING)
             issue_output_dir = self.config.output_dir / f"issue-{self.issue_number}"
-            issue_output_dir.mkdir(parents=True, exist_ok=True)
             # Override config output_dir for this run
             self.config.output_dir = issue_output_dir
 
-            # Phase 2: Read requirements from GitHub issue
+            # Phase 2: Read requirements from GitHub issue (overlaps output dir creation)
             await self.status_manager.set_phase(AnimationPhase.READING_REQUIREMENTS)
-            requirements = await self._get_animation_requirements()
+            async with asyncio.TaskGroup() as tg:
+                requirements_task = tg.create_task(self._get_animation_requirements())
+                tg.create_task(
+                    asyncio.to_thread(issue_output_dir.mkdir, parents=True, exist_ok=True)
+                )
+            requirements = requirements_task.result()
             if not requirements:
                 await self.status_manager.set_blocked("Failed to read animation requirements")
                 return False
@@ -87,16 +250,23 @@ class AnimationWorkerAgent:
             # Import animation tools
             try:
                 from animation_tools import (
+                    BlenderSession,
                     analyze_animation,
                     create_animation,
+                    load_frame_part,
                     render_frames,
                 )
             except ImportError as e:
                 await self.status_manager.set_blocked(f"Failed to import animation tools: {e}")
                 return False
 
+            self._blender = BlenderSession()
+
             # Animation iteration loop
             feedback: list[str] = []
+            # Score and normalized suggestions of the last analyzed iteration
+            prev_score: int | None = None
+            prev_suggestions: tuple[str, ...] = ()
 
             for iteration in range(1, self.config.max_iterations + 1):
                 self.status_manager.log(
@@ -105,54 +275,98 @@ class AnimationWorkerAgent:
                 )
 
                 # Paths for this iteration
-                blend_file = self.config.output_dir / f"animation_v{iteration}.blend"
-                frames_dir = self.config.output_dir / f"frames_v{iteration}"
+                paths = IterationPaths.for_iteration(self.config.output_dir, iteration)
 
                 # Phase 3: Generate animation code with Claude
+                # (may already be running if scheduled at the end of the previous iteration)
                 await self.status_manager.set_phase(AnimationPhase.GENERATING_CODE)
-                animation_code = await self._generate_animation_code(prompt, feedback)
+                if next_code_task is None:
+                    next_code_task = asyncio.create_task(
+                        self._generate_animation_code(prompt, feedback)
+                    )
+                animation_code = await next_code_task
+                next_code_task = None
                 if not animation_code:
                     self.status_manager.log(LogLevel.WARN, "Using placeholder animation code")
 
-                # Phase 4: Create animation in Blender
-                await self.status_manager.set_phase(AnimationPhase.CREATING_ANIMATION)
-                animation_result = create_animation(
-                    prompt=prompt,
-                    output_path=blend_file,
-                    feedback=feedback if feedback else None,
-                    animation_code=animation_code,
-                    fps=self.config.fps,
-                    duration=self.config.duration,
-                )
-
-                if not animation_result.success:
+                # Code an earlier iteration already built renders the same animation,
+                # so reuse its Blender output and Gemini analysis instead of redoing them
+                reused = self._code_results.get(animation_code) if animation_code else None
+                if reused is not None:
+                    paths, analysis_result = reused
                     self.status_manager.log(
-                        LogLevel.ERROR, f"Animation creation failed: {animation_result.message}"
+                        LogLevel.INFO,
+                        "Code unchanged from a previous iteration, reusing its render and analysis",
+                    )
+                else:
+                    # Phase 4: Create animation in Blender
+                    await self.status_manager.set_phase(AnimationPhase.CREATING_ANIMATION)
+                    animation_result = await asyncio.to_thread(
+                        create_animation,
+                        prompt=prompt,
+                        output_path=paths.blend,
+                        feedback=feedback if feedback else None,
+                        animation_code=animation_code,
+                        fps=self.config.fps,
+                        duration=self.config.duration,
+                        session=self._blender,
                     )
-                    continue  # Try again next iteration
-
-                # Phase 5: Render frames
-                await self.status_manager.set_phase(AnimationPhase.RENDERING_FRAMES)
-                render_result = render_frames(
-                    blend_file=blend_file,
-                    output_dir=frames_dir,
-                    resolution=self.config.render_resolution,
-                    samples=self.config.render_samples,
-                )
 
-                if not render_result.success:
-                    self.status_manager.log(
-                        LogLevel.ERROR, f"Rendering failed: {render_result.message}"
+                    if not animation_result.success:
+                        self.status_manager.log(
+                            LogLevel.ERROR, f"Animation creation failed: {animation_result.message}"
+                        )
+                        continue  # Try again next iteration
+
+                    # Phase 5: Render frames, loading each one for Gemini as soon as Blender
+                    # writes it so frame preparation overlaps the rest of the render
+                    await self.status_manager.set_phase(AnimationPhase.RENDERING_FRAMES)
+                    frame_loads: dict[Path, Future[types.Part]] = {}
+                    with ThreadPoolExecutor(max_workers=FRAME_LOADER_WORKERS) as frame_loader:
+
+                        def on_frame(path: Path) -> None:
+                            frame_loads[path] = frame_loader.submit(
+                                load_frame_part, path, self.config.thumbnail_resolution
+                            )
+
+                        render_result = await asyncio.to_thread(
+                            render_frames,
+                            blend_file=paths.blend,
+                            output_dir=paths.frames_dir,
+                            resolution=self.config.render_resolution,
+                            samples=self.config.render_samples,
+                            on_frame=on_frame,
+                            session=self._blender,
+                        )
+                        await asyncio.gather(
+                            *(asyncio.wrap_future(f) for f in frame_loads.values()),
+                            return_exceptions=True,
+                        )
+                    frame_parts = {
+                        path: f.result() for path, f in frame_loads.items() if f.exception() is None
+                    }
+
+                    if not render_result.success:
+                        self.status_manager.log(
+                            LogLevel.ERROR, f"Rendering failed: {render_result.message}"
+                        )
+                        continue  # Try again next iteration
+
+                    # Phase 6: Analyze with Gemini (authoritative verdict)
+                    await self.status_manager.set_phase(AnimationPhase.ANALYZING_QUALITY)
+                    analysis_result = await asyncio.to_thread(
+                        analyze_animation,
+                        frame_paths=render_result.frame_paths,
+                        requirements=quality_requirements,
+                        quality_threshold=self.config.quality_threshold,
+                        frame_parts=frame_parts,
+                        max_frame_size=self.config.thumbnail_resolution,
                     )
-                    continue  # Try again next iteration
-
-                # Phase 6: Analyze with Gemini (authoritative verdict)
-                await self.status_manager.set_phase(AnimationPhase.ANALYZING_QUALITY)
-                analysis_result = analyze_animation(
-                    frame_paths=render_result.frame_paths,
-                    requirements=quality_requirements,
-                    quality_threshold=self.config.quality_threshold,
-                )
+                    if animation_code:
+                        # Cached only once built and rendered, so code that fails in
+                        # Blender is regenerated rather than handed back next iteration
+                        self._code_cache[(prompt, _normalize_feedback(feedback))] = animation_code
+                        self._code_results[animation_code] = (paths, analysis_result)
 
                 # Record iteration
                 await self.status_manager.record_iteration(
@@ -161,8 +375,8 @@ class AnimationWorkerAgent:
                     verdict=analysis_result.verdict,
                     issues=analysis_result.issues,
                     suggestions=analysis_result.suggestions,
-                    blend_file=str(blend_file),
-                    frames_dir=str(frames_dir),
+                    blend_file=paths.blend_str,
+                    frames_dir=paths.frames_str,
                 )
 
                 # Check if done (Gemini's verdict is authoritative)
@@ -175,18 +389,18 @@ class AnimationWorkerAgent:
                     # Set final result
                     await self.status_manager.set_final_result(
                         quality_score=analysis_result.quality_score,
-                        blend_file=str(blend_file),
-                        frames_dir=str(frames_dir),
+                        blend_file=paths.blend_str,
+                        frames_dir=paths.frames_str,
                     )
 
                     # Phase 7: Export to Roblox format
                     await self.status_manager.set_phase(AnimationPhase.EXPORTING_ROBLOX)
-                    roblox_path = await self._export_to_roblox(blend_file)
+                    roblox_path = await self._export_to_roblox(paths)
                     if roblox_path:
                         await self.status_manager.set_final_result(
                             quality_score=analysis_result.quality_score,
-                            blend_file=str(blend_file),
-                            frames_dir=str(frames_dir),
+                            blend_file=paths.blend_str,
+                            frames_dir=paths.frames_str,
                             roblox_export=str(roblox_path),
                         )
 
@@ -200,15 +414,38 @@ class AnimationWorkerAgent:
                         metadata={
                             "iterations": iteration,
                             "quality_score": analysis_result.quality_score,
-                            "blend_file": str(blend_file),
+                            "blend_file": paths.blend_str,
                             "roblox_export": str(roblox_path) if roblox_path else None,
                         },
                     )
                     return True
 
-                # Prepare feedback for next iteration
-                await self.status_manager.set_phase(AnimationPhase.IMPROVING_ANIMATION)
+                # Stop early if Gemini keeps repeating itself and the score has stalled -
+                # further iterations would just burn Claude/Blender/Gemini round-trips
+                suggestions = _normalize_feedback(analysis_result.suggestions)
+                if _is_plateau(
+                    iteration,
+                    analysis_result.quality_score,
+                    suggestions,
+                    prev_score,
+                    prev_suggestions,
+                ):
+                    await self.status_manager.set_blocked(
+                        f"Quality plateau at {analysis_result.quality_score}/100; "
+                        "Gemini feedback is no longer actionable"
+                    )
+                    return False
+                prev_score = analysis_result.quality_score
+                prev_suggestions = suggestions
+
+                # Prepare feedback for next iteration and start generating its code
+                # right away so Claude runs while status bookkeeping is persisted
                 feedback = analysis_result.suggestions
+                if iteration < self.config.max_iterations:
+                    next_code_task = asyncio.create_task(
+                        self._generate_animation_code(prompt, feedback)
+                    )
+                await self.status_manager.set_phase(AnimationPhase.IMPROVING_ANIMATION)
                 self.status_manager.log(
                     LogLevel.INFO,
                     f"Gemini feedback: {len(analysis_result.issues)} issues, "
@@ -234,6 +471,15 @@ class AnimationWorkerAgent:
                     requires_response=True,
                 )
             raise
+        finally:
+            if next_code_task is not None and not next_code_task.done():
+                next_code_task.cancel()
+            if self._blender is not None:
+                await asyncio.to_thread(self._blender.close)
+                self._blender = None
+            if self.github_ops:
+                self.github_ops.close()
+            await self.status_manager.close()
 
     async def _get_animation_requirements(self) -> dict[str, str] | None:
         """Get animation requirements from GitHub issue."""
@@ -241,50 +487,29 @@ class AnimationWorkerAgent:
             return None
 
         try:
-            from github import Github
-
-            github = Github(self.config.github_token)
-            repo = github.get_repo(f"{self.config.repo_owner}/{self.config.repo_name}")
-            issue = repo.get_issue(self.issue_number)
+            if self.github_ops is None:
+                from worker_shared import GitHubOperations
+
+                # Connecting looks up the repo, which blocks
+                self.github_ops = await asyncio.to_thread(
+                    GitHubOperations,
+                    self.config.github_token,
+                    self.config.repo_owner,
+                    self.config.repo_name,
+                    self.status_manager,
+                )
+            issue = await self.github_ops.get_issue(self.issue_number)
 
             # Parse issue body for animation requirements
-            body = issue.body or ""
+            body = issue["body"]
 
             # Default to issue title as prompt if no specific section found
-            prompt = issue.title
+            prompt = issue["title"]
             quality_requirements = "Smooth, natural animation suitable for Roblox game"
 
             # Look for specific sections in the issue body
-            if "## Animation Description" in body or "## Prompt" in body:
-                # Extract prompt from section
-                lines = body.split("\n")
-                in_prompt_section = False
-                prompt_lines = []
-                for line in lines:
-                    if "## Animation Description" in line or "## Prompt" in line:
-                        in_prompt_section = True
-                        continue
-                    if in_prompt_section:
-                        if line.startswith("## "):
-                            break
-                        prompt_lines.append(line)
-                if prompt_lines:
-                    prompt = "\n".join(prompt_lines).strip()
-
-            if "## Quality Requirements" in body:
-                lines = body.split("\n")
-                in_quality_section = False
-                quality_lines = []
-                for line in lines:
-                    if "## Quality Requirements" in line:
-                        in_quality_section = True
-                        continue
-                    if in_quality_section:
-                        if line.startswith("## "):
-                            break
-                        quality_lines.append(line)
-                if quality_lines:
-                    quality_requirements = "\n".join(quality_lines).strip()
+            prompt = _issue_section(body, _PROMPT_SECTION_RE) or prompt
+            quality_requirements = _issue_section(body, _QUALITY_SECTION_RE) or quality_requirements
 
             return {
                 "prompt": prompt,
@@ -302,55 +527,66 @@ class AnimationWorkerAgent:
         if not self.status_manager:
             return None
 
+        cache_key = (prompt, _normalize_feedback(feedback))
+        cached_code = self._code_cache.get(cache_key)
+        if cached_code is not None:
+            self.status_manager.log(
+                LogLevel.INFO, "Feedback unchanged from a previous iteration, reusing its code"
+            )
+            return cached_code
+
         feedback_text = "\n".join(f"- {f}" for f in feedback) if feedback else "None"
 
-        claude_prompt = f"""Generate Blender Python code to create this animation:
+        claude_prompt = self._claude_prompt_template.format(
+            prompt=prompt, feedback_text=feedback_text
+        )
 
-## Animation Request
-{prompt}
+        for max_turns in CODE_GENERATION_MAX_TURNS:
+            response = await self._query_claude(claude_prompt, max_turns)
+            if response is None:
+                return None
 
-## Previous Feedback (if any)
-{feedback_text}
+            code = _extract_code(response)
+            if code is not None:
+                return code
 
-## Requirements
-- Use Blender's Python API (bpy)
-- Animation should be {self.config.duration} seconds at {self.config.fps} fps
-- Total frames: {int(self.config.fps * self.config.duration)}
-- Create smooth, appealing movement suitable for Roblox
-- Use keyframe animation
-- Include proper lighting and camera setup
-- Output ONLY the Python code, no explanations
+            self.status_manager.log(LogLevel.WARN, "Could not extract Python code from response")
 
-## Code Structure
-The code will be inserted into a template that:
-- Clears the scene
-- Sets up fps and frame range
-- Saves the .blend file
+        return None
 
-Your code should:
-1. Create the objects/armature needed
-2. Set up animation keyframes
-3. Add lighting
-4. Position camera
+    async def _query_claude(self, claude_prompt: str, max_turns: int) -> str | None:
+        """
+        Send a code-generation prompt to Claude and return its text response.
 
-Output only valid Python code that uses bpy."""
+        Stops as soon as a turn containing a complete code block arrives rather than
+        letting Claude spend its remaining turns. Returns None on error.
+        """
+        if not self.status_manager:
+            return None
+
+        # Imported here so read-only CLI commands don't pay for the SDK import
+        from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+        from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
 
         options = ClaudeAgentOptions(
             allowed_tools=["Read", "Glob", "Grep"],  # Read-only for code generation
             permission_mode="acceptEdits",
-            max_turns=10,
+            max_turns=max_turns,
         )
 
         try:
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(claude_prompt)
 
-                code_text = ""
+                chunks: list[str] = []
                 async for message in client.receive_response():
                     if isinstance(message, AssistantMessage):
                         for block in message.content:
                             if isinstance(block, TextBlock):
-                                code_text += block.text
+                                chunks.append(block.text)
+                        if _CODE_FENCE_RE.search("".join(chunks)):
+                            await client.interrupt()
+                            break
 
                     if isinstance(message, ResultMessage) and message.is_error:
                         self.status_manager.log(
@@ -358,34 +594,19 @@ Output only valid Python code that uses bpy."""
                         )
                         return None
 
-                # Extract Python code from response
-                if "```python" in code_text:
-                    # Extract code block
-                    start = code_text.find("```python") + 9
-                    end = code_text.find("```", start)
-                    if end > start:
-                        return code_text[start:end].strip()
-
-                # If no code block markers, return as-is if it looks like Python
-                if "import bpy" in code_text or "bpy." in code_text:
-                    return code_text.strip()
-
-                self.status_manager.log(LogLevel.WARN, "Could not extract Python code from response")
-                return None
+                return "".join(chunks)
 
         except Exception as e:
             self.status_manager.log(LogLevel.ERROR, f"Claude SDK error: {e}")
             return None
 
-    async def _export_to_roblox(self, blend_file: Path) -> Path | None:
+    async def _export_to_roblox(self, paths: IterationPaths) -> Path | None:
         """Export animation to Roblox format using anim2rbx."""
         if not self.status_manager:
             return None
 
-        import subprocess
-
-        fbx_file = blend_file.with_suffix(".fbx")
-        rbx_file = blend_file.with_suffix(".rbxmx")
+        fbx_file = paths.fbx
+        rbx_file = paths.rbx
 
         try:
             # First export to FBX from Blender
@@ -399,41 +620,64 @@ bpy.ops.export_scene.fbx(
 )
 print("Exported to FBX: {fbx_file}")
 '''
-            result = subprocess.run(
-                ["blender", "--background", str(blend_file), "--python-expr", export_script],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            if self._blender is not None:
+                await asyncio.to_thread(
+                    self._blender.run_script, export_script, paths.blend, timeout=120
+                )
+            else:
+                await self._run_process(
+                    "blender",
+                    "--background",
+                    paths.blend_str,
+                    "--python-expr",
+                    export_script,
+                    timeout=120,
+                )
 
             if not fbx_file.exists():
                 self.status_manager.log(LogLevel.WARN, "FBX export failed, skipping Roblox export")
                 return None
 
             # Then convert FBX to Roblox using anim2rbx
-            # Note: anim2rbx needs DYLD_LIBRARY_PATH for assimp
-            import os
-
-            env = os.environ.copy()
-            env["DYLD_LIBRARY_PATH"] = "/usr/local/opt/assimp@5/lib"
-
-            result = subprocess.run(
-                ["anim2rbx", str(fbx_file), str(rbx_file)],
-                capture_output=True,
-                text=True,
+            stdout, stderr = await self._run_process(
+                "anim2rbx",
+                str(fbx_file),
+                str(rbx_file),
                 timeout=60,
-                env=env,
+                env=self._anim2rbx_env,
             )
 
             if rbx_file.exists():
                 self.status_manager.log(LogLevel.INFO, f"Exported to Roblox: {rbx_file}")
                 return rbx_file
             else:
-                self.status_manager.log(
-                    LogLevel.WARN, f"anim2rbx failed: {result.stderr or result.stdout}"
-                )
+                self.status_manager.log(LogLevel.WARN, f"anim2rbx failed: {stderr or stdout}")
                 return None
 
         except Exception as e:
             self.status_manager.log(LogLevel.WARN, f"Roblox export failed: {e}")
             return None
+
+    async def _run_process(
+        self,
+        *args: str,
+        timeout: float,
+        env: dict[str, str] | None = None,
+    ) -> tuple[str, str]:
+        """Run a subprocess without blocking the event loop. Returns (stdout, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TimeoutError(f"{args[0]} timed out after {timeout:g} seconds") from None
+        return (
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
@@ -3,16 +3,20 @@ CLI for animation worker agent.
 """
 
 import asyncio
-import json
+import mmap
 import os
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, TypeVar
 
+import orjson
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
 
-from .agent import AnimationWorkerAgent
-from .models import AnimationWorkerConfig
+from .models import AnimationWorkerConfig, LogLevel
+from .status_manager import ITERATIONS_FILE_NAME, LOGS_FILE_NAME, STATUS_FILE_NAME
 
 app = typer.Typer(
     name="animation-worker",
@@ -20,6 +24,15 @@ app = typer.Typer(
 )
 console = Console()
 
+T = TypeVar("T")
+
+# Status files are read concurrently; reads are latency-bound on network filesystems
+STATUS_READ_WORKERS = 16
+
+# Console styles for status output, by log level and by final phase
+_LOG_LEVEL_STYLES = {"debug": "dim", "info": "blue", "warn": "yellow", "error": "red"}
+_PHASE_STYLES = {"completed": "green", "failed": "red", "blocked": "yellow"}
+
 
 @app.command()
 def run(
@@ -59,7 +72,7 @@ def run(
         None,
         "--notification-file",
         "-n",
-        help="File for manager notifications",
+        help="File for manager notifications (JSON Lines, appended)",
     ),
     max_iterations: int = typer.Option(
         10,
@@ -81,6 +94,12 @@ def run(
         "--duration",
         help="Animation duration in seconds",
     ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.INFO,
+        "--log-level",
+        help="Lowest log level to print and record",
+        case_sensitive=False,
+    ),
 ) -> None:
     """
     Run the animation worker to create an animation from a GitHub issue.
@@ -93,6 +112,9 @@ def run(
     5. Iterate until quality threshold is met
     6. Export to Roblox format
     """
+    # Deferred so `status` and `list-workers` don't import the Claude SDK
+    from .agent import AnimationWorkerAgent
+
     load_dotenv()
 
     # Parse repo
@@ -113,20 +135,22 @@ def run(
     if not gemini_api_key:
         console.print("[yellow]Warning: GEMINI_API_KEY not set, Gemini analysis will fail[/yellow]")
 
+    # Made absolute as given; symlinks are left unresolved
     config = AnimationWorkerConfig(
         github_token=github_token,
         repo_owner=repo_owner,
         repo_name=repo_name,
-        base_dir=base_dir.resolve(),
-        worktree_base_dir=worktree_dir.resolve(),
-        output_dir=output_dir.resolve(),
-        status_dir=status_dir.resolve(),
-        manager_notification_file=notification_file.resolve() if notification_file else None,
+        base_dir=base_dir.absolute(),
+        worktree_base_dir=worktree_dir.absolute(),
+        output_dir=output_dir.absolute(),
+        status_dir=status_dir.absolute(),
+        manager_notification_file=notification_file.absolute() if notification_file else None,
         max_iterations=max_iterations,
         quality_threshold=quality_threshold,
         fps=fps,
         duration=duration,
         gemini_api_key=gemini_api_key,
+        min_log_level=log_level,
     )
 
     console.print(f"[bold blue]Starting animation worker for issue #{issue_number}[/bold blue]")
@@ -138,7 +162,7 @@ def run(
     agent = AnimationWorkerAgent(config, issue_number)
 
     try:
-        success = asyncio.run(agent.run())
+        success = _run_async(agent.run())
         if success:
             console.print("[bold green]Animation worker completed successfully![/bold green]")
             raise typer.Exit(0)
@@ -164,13 +188,16 @@ def status(
     ),
 ) -> None:
     """Check the status of a running or completed animation worker."""
-    status_file = status_dir / f"animation-worker-{issue_number}.json"
+    status_file = status_dir / STATUS_FILE_NAME.format(issue_number=issue_number)
 
-    if not status_file.exists():
+    # A missing file surfaces as FileNotFoundError; no separate exists() check
+    try:
+        data = orjson.loads(status_file.read_bytes())
+    except FileNotFoundError:
         console.print(f"[yellow]No status file found for issue #{issue_number}[/yellow]")
-        raise typer.Exit(1)
-
-    data = json.loads(status_file.read_text())
+        raise typer.Exit(1) from None
+    logs_file = status_dir / LOGS_FILE_NAME.format(issue_number=issue_number)
+    iterations_file = status_dir / ITERATIONS_FILE_NAME.format(issue_number=issue_number)
 
     console.print(f"[bold]Animation Worker Status for Issue #{issue_number}[/bold]")
     console.print(f"PID: {data['pid']}")
@@ -191,7 +218,10 @@ def status(
         console.print(f"[red]Blocked: {data['blocked_reason']}[/red]")
 
     # Show iteration history
-    iterations = data.get("iterations", [])
+    try:
+        iterations = [orjson.loads(line) for line in iterations_file.read_bytes().splitlines()]
+    except FileNotFoundError:
+        iterations = data.get("iterations", [])  # Status written before logs were split out
     if iterations:
         console.print("\n[bold]Iteration History:[/bold]")
         for it in iterations:
@@ -202,12 +232,16 @@ def status(
             )
 
     # Show recent logs
-    logs = data.get("logs", [])[-10:]
+    try:
+        logs = _read_jsonl_tail(logs_file, 10)
+    except FileNotFoundError:
+        logs = data.get("logs", [])[-10:]
     if logs:
         console.print("\n[bold]Recent Logs:[/bold]")
         for log in logs:
-            style = {"debug": "dim", "info": "blue", "warn": "yellow", "error": "red"}
-            console.print(f"  [{log['level']}] {log['message']}", style=style.get(log["level"]))
+            console.print(
+                f"  [{log['level']}] {log['message']}", style=_LOG_LEVEL_STYLES.get(log["level"])
+            )
 
 
 @app.command()
@@ -220,11 +254,11 @@ def list_workers(
     ),
 ) -> None:
     """List all animation worker status files."""
-    if not status_dir.exists():
+    try:
+        status_files = _find_status_files(status_dir, "animation-worker-")
+    except FileNotFoundError:
         console.print("[yellow]No status directory found[/yellow]")
-        raise typer.Exit(0)
-
-    status_files = list(status_dir.glob("animation-worker-*.json"))
+        raise typer.Exit(0) from None
 
     if not status_files:
         console.print("[yellow]No animation worker status files found[/yellow]")
@@ -232,26 +266,79 @@ def list_workers(
 
     console.print("[bold]Animation Workers:[/bold]")
 
-    for sf in sorted(status_files):
-        try:
-            data = json.loads(sf.read_text())
-            phase = data.get("phase", "unknown")
-            issue = data.get("issue_number", "?")
-            quality = data.get("final_quality_score", 0)
-            iteration = data.get("current_iteration", 0)
+    with ThreadPoolExecutor(max_workers=min(STATUS_READ_WORKERS, len(status_files))) as ex:
+        # Rows print in order as their files are read
+        for sf, data in zip(status_files, ex.map(_read_status_file, status_files), strict=True):
+            if data is None:
+                console.print(f"  {sf.name}: [red]error reading[/red]")
+                continue
 
-            phase_style = {
-                "completed": "green",
-                "failed": "red",
-                "blocked": "yellow",
-            }.get(phase, "blue")
+            try:
+                phase = data.get("phase", "unknown")
+                issue = data.get("issue_number", "?")
+                quality = data.get("final_quality_score", 0)
+                iteration = data.get("current_iteration", 0)
 
-            console.print(
-                f"  Issue #{issue}: [{phase_style}]{phase}[/{phase_style}] "
-                f"(iteration {iteration}, quality {quality}/100)"
-            )
-        except Exception:
-            console.print(f"  {sf.name}: [red]error reading[/red]")
+                phase_style = _PHASE_STYLES.get(phase, "blue")
+
+                console.print(
+                    f"  Issue #{issue}: [{phase_style}]{phase}[/{phase_style}] "
+                    f"(iteration {iteration}, quality {quality}/100)"
+                )
+            except Exception:
+                console.print(f"  {sf.name}: [red]error reading[/red]")
+
+
+def _run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when it's installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+def _find_status_files(status_dir: Path, prefix: str) -> list[Path]:
+    """Status files in status_dir named {prefix}*.json, sorted by name.
+
+    Uses os.scandir, which returns names straight from the directory listing
+    without glob's per-entry pattern matching and Path construction.
+    """
+    with os.scandir(status_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".json")
+        )
+    return [status_dir / name for name in names]
+
+
+def _read_status_file(path: Path) -> dict[str, Any] | None:
+    """Read and parse a status file, returning None if it can't be read."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _read_jsonl_tail(path: Path, count: int) -> list[dict[str, Any]]:
+    """Parse the last `count` records of a JSON Lines file without reading all of it."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Walk back from the end one line at a time; only those lines are copied
+            lines: list[bytes] = []
+            end = len(mm)
+            while end > 0 and len(lines) < count:
+                start = mm.rfind(b"\n", 0, end - 1) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start
+
+    return [orjson.loads(line) for line in reversed(lines)]
 
 
 if __name__ == "__main__":
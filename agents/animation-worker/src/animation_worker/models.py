@@ -7,7 +7,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from worker_shared import StatusLogs
 
 
 class AnimationPhase(str, Enum):
@@ -38,6 +39,8 @@ class LogLevel(str, Enum):
 class LogEntry(BaseModel):
     """Single log entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(default_factory=datetime.now)
     level: LogLevel
     message: str
@@ -66,10 +69,15 @@ class AnimationWorkerConfig(BaseModel):
     duration: float = 2.0
     render_resolution: tuple[int, int] = (1280, 720)
     render_samples: int = 16
+    # Frames are downscaled to fit this box before being sent to Gemini (None = full size)
+    thumbnail_resolution: tuple[int, int] | None = (224, 224)
 
     # Behavior configuration
     max_retries: int = 3
 
+    # Log entries below this level are dropped before any work is done
+    min_log_level: LogLevel = LogLevel.INFO
+
     # Gemini API key
     gemini_api_key: str | None = None
 
@@ -80,6 +88,8 @@ class AnimationWorkerConfig(BaseModel):
 class IterationStatus(BaseModel):
     """Status of a single animation iteration."""
 
+    model_config = ConfigDict(frozen=True)
+
     iteration_number: int
     quality_score: int
     verdict: str  # "done" or "needs_work"
@@ -101,7 +111,7 @@ class AnimationWorkerStatus(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     commits: list[str] = Field(default_factory=list)
     blocked_reason: str | None = None
-    logs: list[LogEntry] = Field(default_factory=list)
+    logs: StatusLogs[LogEntry]
 
     # Animation-specific status
     current_iteration: int = 0
@@ -127,6 +137,8 @@ class NotificationType(str, Enum):
 class ManagerNotification(BaseModel):
     """Message to manager (written to notification file)."""
 
+    model_config = ConfigDict(frozen=True)
+
     worker_pid: int
     issue_number: int
     notification_type: NotificationType
@@ -4,12 +4,17 @@ Status manager for animation worker agent.
 Handles logging, status persistence, and manager notifications.
 """
 
-import json
+import asyncio
+import contextlib
 import os
+import time
+from collections import deque
 from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
 from rich.console import Console
+from worker_shared import MAX_STATUS_LOGS, append_bytes, write_atomic
 
 from .models import (
     AnimationPhase,
@@ -24,6 +29,55 @@ from .models import (
 
 console = Console()
 
+# Console style and icon for each log level
+_LOG_STYLES = {
+    LogLevel.DEBUG: "dim",
+    LogLevel.INFO: "blue",
+    LogLevel.WARN: "yellow",
+    LogLevel.ERROR: "red bold",
+}
+_LOG_ICONS = {
+    LogLevel.DEBUG: "🔍",
+    LogLevel.INFO: "🎬",
+    LogLevel.WARN: "⚠️",
+    LogLevel.ERROR: "❌",
+}
+# Severity order used to filter against config.min_log_level
+_LOG_LEVEL_RANK = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARN: 2,
+    LogLevel.ERROR: 3,
+}
+
+# updated_at only needs coarse precision, so the clock is read at most this often
+TIMESTAMP_REFRESH_SECONDS = 0.5
+
+# Status changes made within this window after the first one are written together
+WRITE_COALESCE_SECONDS = 0.25
+
+# After a failed write, retries back off from WRITE_COALESCE_SECONDS up to this
+WRITE_RETRY_MAX_SECONDS = 30.0
+
+# Status is split so each update writes only what changed: a small header rewritten
+# in place, plus append-only JSON Lines files for the unbounded logs and iterations
+STATUS_FILE_NAME = "animation-worker-{issue_number}.json"
+LOGS_FILE_NAME = "animation-worker-{issue_number}.logs.jsonl"
+ITERATIONS_FILE_NAME = "animation-worker-{issue_number}.iterations.jsonl"
+
+# Fields of AnimationWorkerStatus kept out of the header file
+_APPENDED_FIELDS = {"logs", "iterations"}
+
+# Notifications are appended with one os.write() on an O_APPEND descriptor, which
+# keeps each line whole when several workers share the notification file
+_NOTIFICATION_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+# Serializers for records written on every status flush or notification, built once
+_dump_status = TypeAdapter(AnimationWorkerStatus).dump_json
+_dump_log_entry = TypeAdapter(LogEntry).dump_json
+_dump_iteration = TypeAdapter(IterationStatus).dump_json
+_dump_notification = TypeAdapter(ManagerNotification).dump_json
+
 
 class AnimationStatusManager:
     """
@@ -39,7 +93,13 @@ class AnimationStatusManager:
         worktree_path: str,
     ) -> None:
         self.config = config
-        self.status_file_path = config.status_dir / f"animation-worker-{issue_number}.json"
+        self.status_file_path = config.status_dir / STATUS_FILE_NAME.format(
+            issue_number=issue_number
+        )
+        self.logs_file_path = config.status_dir / LOGS_FILE_NAME.format(issue_number=issue_number)
+        self.iterations_file_path = config.status_dir / ITERATIONS_FILE_NAME.format(
+            issue_number=issue_number
+        )
 
         self.status = AnimationWorkerStatus(
             pid=os.getpid(),
@@ -48,60 +108,114 @@ class AnimationStatusManager:
             worktree_path=worktree_path,
         )
 
+        # Buffered changes for the background writer (_write_loop)
+        self._dirty = False
+        self._pending_logs: list[LogEntry] = []
+        self._pending_iterations: list[IterationStatus] = []
+        self._write_requested = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Set by close() to stop the background writer between writes
+        self._closing = asyncio.Event()
+
+        # Copy returned by get_status(), reused until the next change
+        self._snapshot: AnimationWorkerStatus | None = None
+
+        # Manager notification file descriptor, opened on first notification and kept open
+        self._notification_fd: int | None = None
+
+        # Levels below config.min_log_level are dropped by log()
+        self._min_log_rank = _LOG_LEVEL_RANK[config.min_log_level]
+
+        # "[phase]" shown before each console log line
+        self._phase_tag = f"[{self.status.phase.value}]"
+
+        # Cached clock reading for updated_at, see _now()
+        self._now_cached = datetime.now()
+        self._now_refreshed_at = time.monotonic()
+
     async def initialize(self) -> None:
         """Initialize status file - creates directory if needed."""
         self.config.status_dir.mkdir(parents=True, exist_ok=True)
-        await self._persist()
+        # Start fresh logs/iterations if a previous run for this issue left some behind
+        self.logs_file_path.write_bytes(b"")
+        self.iterations_file_path.write_bytes(b"")
+        self._request_write()
+        await self.flush()
         self.log(
             LogLevel.INFO, f"Animation worker started for issue #{self.status.issue_number}"
         )
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def close(self) -> None:
+        """Stop the background writer and write any pending changes."""
+        if self._writer_task is not None:
+            # Stops after any write in progress; cancelling wouldn't stop its thread
+            self._closing.set()
+            self._write_requested.set()
+            await self._writer_task
+            self._writer_task = None
+        await self.flush()
+        if self._notification_fd is not None:
+            os.close(self._notification_fd)
+            self._notification_fd = None
 
     def log(self, level: LogLevel, message: str) -> None:
         """Add log entry."""
-        entry = LogEntry(level=level, message=message)
+        if _LOG_LEVEL_RANK[level] < self._min_log_rank:
+            return
+        # Unvalidated entry, timestamped with the same reading as updated_at
+        now = datetime.now()
+        entry = LogEntry.model_construct(timestamp=now, level=level, message=message)
         self.status.logs.append(entry)
-        self.status.updated_at = datetime.now()
-
-        # Output to console with rich formatting
-        style_map = {
-            LogLevel.DEBUG: "dim",
-            LogLevel.INFO: "blue",
-            LogLevel.WARN: "yellow",
-            LogLevel.ERROR: "red bold",
-        }
-        icon_map = {
-            LogLevel.DEBUG: "🔍",
-            LogLevel.INFO: "🎬",
-            LogLevel.WARN: "⚠️",
-            LogLevel.ERROR: "❌",
-        }
+        self._pending_logs.append(entry)
+        self.status.updated_at = now
+        self._request_write()
 
+        # Console line in the level's style, printed as plain text
         console.print(
-            f"{icon_map[level]} [{self.status.phase.value}] {message}",
-            style=style_map[level],
+            _LOG_ICONS[level],
+            self._phase_tag,
+            message,
+            style=_LOG_STYLES[level],
+            markup=False,
+            highlight=False,
         )
 
+    def is_logged(self, level: LogLevel) -> bool:
+        """Whether log() keeps entries at this level (to skip building dropped messages)."""
+        return _LOG_LEVEL_RANK[level] >= self._min_log_rank
+
     async def set_phase(self, phase: AnimationPhase) -> None:
         """Update phase."""
         self.status.phase = phase
-        self.status.updated_at = datetime.now()
+        self._phase_tag = f"[{self.status.phase.value}]"
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Phase changed to: {phase.value}")
-        await self._persist()
+        self._request_write()
+        # Notify the manager of the new phase
+        await self.notify_manager(
+            NotificationType.STATUS_UPDATE,
+            f"Phase changed to: {phase.value}",
+            requires_response=False,
+            metadata={"phase": phase.value},
+        )
 
     async def add_commit(self, sha: str) -> None:
         """Record a commit."""
         self.status.commits.append(sha)
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Commit: {sha[:7]}")
-        await self._persist()
+        self._request_write()
 
     async def set_blocked(self, reason: str) -> None:
         """Mark as blocked - requires manager intervention."""
         self.status.phase = AnimationPhase.BLOCKED
+        self._phase_tag = f"[{self.status.phase.value}]"
         self.status.blocked_reason = reason
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.WARN, f"Blocked: {reason}")
-        await self._persist()
+        self._request_write()
         await self.notify_manager(NotificationType.BLOCKED, reason, requires_response=True)
 
     async def record_iteration(
@@ -115,7 +229,7 @@ class AnimationStatusManager:
         frames_dir: str | None = None,
     ) -> None:
         """Record an animation iteration result."""
-        iteration = IterationStatus(
+        iteration = IterationStatus.model_construct(
             iteration_number=iteration_number,
             quality_score=quality_score,
             verdict=verdict,
@@ -125,15 +239,16 @@ class AnimationStatusManager:
             frames_dir=frames_dir,
         )
         self.status.iterations.append(iteration)
+        self._pending_iterations.append(iteration)
         self.status.current_iteration = iteration_number
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
 
         self.log(
             LogLevel.INFO,
             f"Iteration {iteration_number}: {verdict} (quality: {quality_score}/100)",
         )
 
-        await self._persist()
+        self._request_write()
         await self.notify_manager(
             NotificationType.ITERATION_COMPLETE,
             f"Iteration {iteration_number} complete: {verdict} (quality: {quality_score}/100)",
@@ -157,19 +272,100 @@ class AnimationStatusManager:
         self.status.final_blend_file = blend_file
         self.status.final_frames_dir = frames_dir
         self.status.roblox_export_path = roblox_export
-        self.status.updated_at = datetime.now()
-        await self._persist()
+        self.status.updated_at = self._now()
+        self._request_write()
 
     def get_status(self) -> AnimationWorkerStatus:
-        """Get current status."""
-        return self.status.model_copy()
-
-    async def _persist(self) -> None:
-        """Persist status to file."""
-        self.status_file_path.write_text(
-            self.status.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+        """Get a copy of the current status, shared between calls until status changes."""
+        if self._snapshot is None:
+            # Logs and iterations are frozen models, so copying the containers is
+            # enough to keep later updates from showing through
+            status = self.status
+            self._snapshot = status.model_copy(
+                update={
+                    "logs": deque(status.logs, maxlen=status.logs.maxlen),
+                    "commits": list(status.commits),
+                    "iterations": list(status.iterations),
+                }
+            )
+        return self._snapshot
+
+    async def flush(self) -> None:
+        """Write pending status changes to disk now."""
+        async with self._write_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+
+            # Snapshot of the current state; _write_files runs in a thread
+            logs, self._pending_logs = self._pending_logs, []
+            iterations, self._pending_iterations = self._pending_iterations, []
+            header = _dump_status(self.status, exclude=_APPENDED_FIELDS)
+            log_lines = b"".join(_dump_log_entry(entry) + b"\n" for entry in logs)
+            iteration_lines = b"".join(_dump_iteration(it) + b"\n" for it in iterations)
+
+            try:
+                await asyncio.to_thread(self._write_files, header, log_lines, iteration_lines)
+            except OSError:
+                # Retried on the next flush, logs capped like status.logs
+                self._pending_logs[:0] = logs
+                del self._pending_logs[:-MAX_STATUS_LOGS]
+                self._pending_iterations[:0] = iterations
+                self._dirty = True
+                raise
+
+    def _write_files(self, header: bytes, log_lines: bytes, iteration_lines: bytes) -> None:
+        """Append new logs/iterations and replace the status header."""
+        append_bytes(self.logs_file_path, log_lines)
+        append_bytes(self.iterations_file_path, iteration_lines)
+        write_atomic(self.status_file_path, header)
+
+    def _request_write(self) -> None:
+        """Mark status as changed and wake the background writer."""
+        self._snapshot = None
+        self._dirty = True
+        self._write_requested.set()
+
+    async def _write_loop(self) -> None:
+        """Write status changes as they come in, retrying failed writes with backoff."""
+        failures = 0
+        last_error: OSError | None = None
+        while True:
+            await self._write_requested.wait()
+            delay = min(WRITE_COALESCE_SECONDS * 2**failures, WRITE_RETRY_MAX_SECONDS)
+            # Cut short by close(), which writes whatever is pending itself
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), delay)
+            if self._closing.is_set():
+                return
+            self._write_requested.clear()
+            try:
+                await self.flush()
+            except OSError as e:
+                failures += 1
+                last_error = e
+                console.print(
+                    f"Failed to write status file (attempt {failures}): {e}",
+                    style=_LOG_STYLES[LogLevel.ERROR],
+                    markup=False,
+                    highlight=False,
+                )
+                self._write_requested.set()  # Retry after the backoff
+                continue
+            if failures:
+                self.log(
+                    LogLevel.WARN,
+                    f"Status file written after {failures} failed attempts: {last_error}",
+                )
+                failures = 0
+
+    def _now(self) -> datetime:
+        """Current time, refreshed at most every TIMESTAMP_REFRESH_SECONDS."""
+        now = time.monotonic()
+        if now - self._now_refreshed_at > TIMESTAMP_REFRESH_SECONDS:
+            self._now_cached = datetime.now()
+            self._now_refreshed_at = now
+        return self._now_cached
 
     async def notify_manager(
         self,
@@ -192,21 +388,16 @@ class AnimationStatusManager:
         )
 
         try:
-            # Read existing notifications
-            existing: list[dict[str, Any]] = []
-            if self.config.manager_notification_file.exists():
-                content = self.config.manager_notification_file.read_text(encoding="utf-8")
-                if content.strip():
-                    existing = json.loads(content)
-
-            # Append new notification
-            existing.append(notification.model_dump(mode="json"))
-
-            # Write back
-            self.config.manager_notification_file.write_text(
-                json.dumps(existing, indent=2, default=str),
-                encoding="utf-8",
-            )
+            if self._notification_fd is None:
+                self._notification_fd = os.open(
+                    self.config.manager_notification_file, _NOTIFICATION_OPEN_FLAGS, 0o644
+                )
+            # Notifications are JSON Lines: append one object per line. Unbuffered, so
+            # the manager sees it right away; notifications needing a response are
+            # also forced to disk
+            os.write(self._notification_fd, _dump_notification(notification) + b"\n")
+            if requires_response:
+                await asyncio.to_thread(os.fsync, self._notification_fd)
             self.log(LogLevel.DEBUG, f"Notified manager: {notification_type.value}")
         except Exception as e:
             self.log(LogLevel.ERROR, f"Failed to notify manager: {e}")
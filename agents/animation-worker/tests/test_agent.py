@@ -0,0 +1,98 @@
+"""Tests for the animation worker's code extraction and iteration helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from animation_worker.agent import (
+    _PROMPT_SECTION_RE,
+    AnimationWorkerAgent,
+    _extract_code,
+    _is_plateau,
+    _issue_section,
+    _normalize_feedback,
+)
+from animation_worker.models import AnimationWorkerConfig
+from animation_worker.status_manager import AnimationStatusManager
+
+
+def test_extract_code_merges_fenced_blocks_in_order() -> None:
+    """Every non-empty python/py/bare fence is kept, in the order it appears."""
+    response = (
+        "Here is the setup:\n```python\nimport bpy\n```\n"
+        "Then the keyframes:\n```PY\nbpy.ops.object.select_all()\n```\n"
+        "```\n\n```\nand a helper:\n```\nx = 1\n```"
+    )
+
+    assert _extract_code(response) == "import bpy\n\nbpy.ops.object.select_all()\n\nx = 1"
+
+
+def test_extract_code_without_fences() -> None:
+    """Unfenced responses are used only if they look like bpy code."""
+    assert _extract_code("  import bpy\nbpy.context.scene.frame_end = 60\n") == (
+        "import bpy\nbpy.context.scene.frame_end = 60"
+    )
+    assert _extract_code("I can't generate that animation.") is None
+
+
+def test_normalize_feedback_ignores_order_case_and_spacing() -> None:
+    assert _normalize_feedback(["Raise  the arm", "smooth the LANDING", " "]) == (
+        _normalize_feedback(["Smooth the landing", "raise the arm"])
+    )
+
+
+def test_is_plateau_needs_repeated_feedback_and_a_stalled_score() -> None:
+    suggestions = ("raise the arm",)
+
+    assert _is_plateau(3, 71, suggestions, 70, suggestions)
+    assert not _is_plateau(2, 71, suggestions, 70, suggestions)  # Too early
+    assert not _is_plateau(3, 75, suggestions, 70, suggestions)  # Still improving
+    assert not _is_plateau(3, 70, suggestions, 70, ("bend the knee",))  # New feedback
+    assert not _is_plateau(3, 70, suggestions, None, suggestions)  # Nothing analyzed before
+
+
+def test_issue_section_takes_first_matching_heading() -> None:
+    """Headings match anywhere in the line; ### subsections stay in the section."""
+    body = (
+        "Intro\n## Prompt (required)\nA jumping jack\n### Notes\nKeep it loopable\n"
+        "## Animation Description\nIgnored, an earlier heading matched\n"
+    )
+
+    assert _issue_section(body, _PROMPT_SECTION_RE) == (
+        "A jumping jack\n### Notes\nKeep it loopable"
+    )
+    assert _issue_section("No sections here", _PROMPT_SECTION_RE) == ""
+
+
+async def test_generated_code_is_not_reused_until_built(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Code that hasn't built and rendered yet is regenerated for the same feedback."""
+    config = AnimationWorkerConfig(
+        github_token="token",
+        repo_owner="owner",
+        repo_name="repo",
+        base_dir=tmp_path,
+        worktree_base_dir=tmp_path,
+        output_dir=tmp_path,
+        status_dir=tmp_path,
+    )
+    agent = AnimationWorkerAgent(config, 7)
+    agent.status_manager = AnimationStatusManager(config, 7, "animation/issue-7", str(tmp_path))
+    queries = 0
+
+    async def query_claude(claude_prompt: str, max_turns: int) -> str:
+        nonlocal queries
+        queries += 1
+        return f"```python\nimport bpy  # attempt {queries}\n```"
+
+    monkeypatch.setattr(agent, "_query_claude", query_claude)
+
+    first = await agent._generate_animation_code("wave", ["raise the arm"])
+    second = await agent._generate_animation_code("wave", ["raise the arm"])
+    assert (first, second) == ("import bpy  # attempt 1", "import bpy  # attempt 2")
+
+    # As run() records code once Blender has built and rendered it
+    agent._code_cache[("wave", _normalize_feedback(["Raise the arm"]))] = "built"
+    assert await agent._generate_animation_code("wave", ["raise the arm"]) == "built"
+    assert queries == 2
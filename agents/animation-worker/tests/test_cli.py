@@ -0,0 +1,16 @@
+"""Tests for the animation worker CLI's status file readers."""
+
+from pathlib import Path
+
+from animation_worker.cli import _read_jsonl_tail
+
+
+def test_read_jsonl_tail(tmp_path: Path) -> None:
+    """Returns the last records oldest first, skipping blank lines."""
+    path = tmp_path / "animation-worker-7.iterations.jsonl"
+    path.write_bytes(b"")
+    assert _read_jsonl_tail(path, 3) == []
+
+    path.write_bytes(b'{"n": 1}\n\n{"n": 2}\n{"n": 3}\n')
+    assert _read_jsonl_tail(path, 2) == [{"n": 2}, {"n": 3}]
+    assert _read_jsonl_tail(path, 10) == [{"n": 1}, {"n": 2}, {"n": 3}]
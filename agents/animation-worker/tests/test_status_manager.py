@@ -0,0 +1,98 @@
+"""Tests for the animation status manager's background writer."""
+
+import asyncio
+from pathlib import Path
+
+import orjson
+import pytest
+
+from animation_worker import status_manager as status_module
+from animation_worker.models import AnimationPhase, AnimationWorkerConfig, LogLevel
+from animation_worker.status_manager import AnimationStatusManager
+
+
+@pytest.fixture(autouse=True)
+def fast_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shorten the coalescing window so tests don't wait on it."""
+    monkeypatch.setattr(status_module, "WRITE_COALESCE_SECONDS", 0.01)
+
+
+def make_manager(status_dir: Path) -> AnimationStatusManager:
+    config = AnimationWorkerConfig(
+        github_token="token",
+        repo_owner="owner",
+        repo_name="repo",
+        base_dir=Path("/base"),
+        worktree_base_dir=Path("/worktrees"),
+        output_dir=Path("/output"),
+        status_dir=status_dir,
+    )
+    return AnimationStatusManager(config, 7, "animation/issue-7", "/worktrees/animation-7")
+
+
+async def test_burst_of_updates_is_written_once(tmp_path: Path) -> None:
+    """An iteration, its phase change and log lines share one write."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+    await manager.flush()  # Write the startup log line before counting
+
+    write_files = manager._write_files
+    writes = 0
+
+    def counting_write(*args: bytes) -> None:
+        nonlocal writes
+        writes += 1
+        write_files(*args)
+
+    manager._write_files = counting_write  # type: ignore[method-assign]
+    await manager.record_iteration(1, 60, "needs_work", ["stiff"], ["bend the knees"])
+    await manager.set_phase(AnimationPhase.IMPROVING_ANIMATION)
+    manager.log(LogLevel.INFO, "improving")
+    await asyncio.sleep(0.05)
+    await manager.close()  # Waits for the write; nothing is left for it to write
+
+    assert writes == 1
+    status = orjson.loads((tmp_path / "animation-worker-7.json").read_bytes())
+    assert status["phase"] == AnimationPhase.IMPROVING_ANIMATION.value
+    assert status["current_iteration"] == 1
+    iterations = (tmp_path / "animation-worker-7.iterations.jsonl").read_bytes().splitlines()
+    assert [orjson.loads(line)["quality_score"] for line in iterations] == [60]
+    logs = (tmp_path / "animation-worker-7.logs.jsonl").read_bytes().splitlines()
+    assert orjson.loads(logs[-1])["message"] == "improving"
+
+
+async def test_failed_write_is_retried_with_pending_entries(tmp_path: Path) -> None:
+    """Entries from a failed write are written, once, by the next one."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+
+    write_files = manager._write_files
+
+    def failing_write(*args: bytes) -> None:
+        raise OSError("disk full")
+
+    manager._write_files = failing_write  # type: ignore[method-assign]
+    manager.log(LogLevel.INFO, "kept")
+    with pytest.raises(OSError):
+        await manager.flush()
+
+    manager._write_files = write_files  # type: ignore[method-assign]
+    await manager.close()
+
+    logs = (tmp_path / "animation-worker-7.logs.jsonl").read_bytes().splitlines()
+    assert [orjson.loads(line)["message"] for line in logs].count("kept") == 1
+
+
+async def test_get_status_is_independent_of_live_status(tmp_path: Path) -> None:
+    """The snapshot doesn't see later updates, and changing it doesn't change the status."""
+    manager = make_manager(tmp_path)
+    snapshot = manager.get_status()
+    assert manager.get_status() is snapshot  # Reused until the status changes
+
+    await manager.record_iteration(1, 60, "needs_work", [], [])
+    snapshot.commits.append("abc1234")
+
+    assert snapshot.iterations == []
+    assert not snapshot.logs
+    assert manager.status.commits == []
+    assert manager.get_status().logs.maxlen == manager.status.logs.maxlen
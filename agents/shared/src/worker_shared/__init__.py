@@ -3,12 +3,20 @@ Shared components for Claude worker agents.
 
 This library provides common functionality for different types of worker agents:
 - Base models and enums
-- Status management and logging
+- The status manager interface used by the git and GitHub helpers
 - Git operations
 - GitHub API operations
+- TTL caching for async lookups
+- Atomic and append-only status file writes
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base_models import (
+    COMMITS_FILE_NAME,
+    LOGS_FILE_NAME,
+    MAX_STATUS_LOGS,
+    STATUS_FILE_NAME,
     BaseWorkerConfig,
     BaseWorkerStatus,
     CIStatus,
@@ -19,12 +27,21 @@ from .base_models import (
     PRReview,
     ReviewComment,
     ReviewStatus,
+    StatusLogs,
 )
 from .base_status import BaseStatusManager
-from .git_ops import GitOperations
-from .github_ops import GitHubOperations
+from .status_files import append_bytes, write_atomic
+from .ttl_cache import TTLCache, ttl_cache
+
+if TYPE_CHECKING:
+    from .git_ops import GitOperations
+    from .github_ops import GitHubOperations
 
 __all__ = [
+    "COMMITS_FILE_NAME",
+    "LOGS_FILE_NAME",
+    "MAX_STATUS_LOGS",
+    "STATUS_FILE_NAME",
     "BaseWorkerConfig",
     "BaseWorkerStatus",
     "CIStatus",
@@ -35,7 +52,30 @@ __all__ = [
     "PRReview",
     "ReviewComment",
     "ReviewStatus",
+    "StatusLogs",
     "BaseStatusManager",
     "GitOperations",
     "GitHubOperations",
+    "TTLCache",
+    "ttl_cache",
+    "append_bytes",
+    "write_atomic",
 ]
+
+# Loaded on first access so importing the models doesn't pull in PyGithub or rich
+_LAZY_EXPORTS = {
+    "GitOperations": ".git_ops",
+    "GitHubOperations": ".github_ops",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported class on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,12 +5,46 @@ These models are shared across different worker types (PR worker, animation work
 Specific workers extend these with their own specialized models.
 """
 
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# Log entries held in a worker status's logs field
+MAX_STATUS_LOGS = 500
+
+# Worker status files in the status dir. Defined with the models rather than a status
+# manager so CLIs can read them without importing the manager (and rich)
+STATUS_FILE_NAME = "worker-{issue_number}.json"
+
+# Log entries go to an append-only JSON Lines file next to the status file, so
+# persisting status doesn't re-serialize the whole log history every time
+LOGS_FILE_NAME = "worker-{issue_number}.logs.jsonl"
+
+# Commit SHAs are journaled the same way, one per line, so recording a commit
+# appends a few bytes instead of growing the rewritten status file
+COMMITS_FILE_NAME = "worker-{issue_number}.commits.log"
+
+EntryT = TypeVar("EntryT")
+
+
+def _cap_status_logs(logs: deque[EntryT]) -> deque[EntryT]:
+    """Keep the MAX_STATUS_LOGS bound on logs passed in (validation builds a plain deque)."""
+    if logs.maxlen == MAX_STATUS_LOGS:
+        return logs
+    return deque(logs, maxlen=MAX_STATUS_LOGS)
+
+
+# Type of a worker status's logs field, e.g. StatusLogs[LogEntry]. Only recent
+# entries are kept in memory; the full log is in the logs JSON Lines file
+StatusLogs = Annotated[
+    deque[EntryT],
+    AfterValidator(_cap_status_logs),
+    Field(default_factory=lambda: deque(maxlen=MAX_STATUS_LOGS)),
+]
 
 
 class LogLevel(str, Enum):
@@ -25,6 +59,8 @@ class LogLevel(str, Enum):
 class LogEntry(BaseModel):
     """Single log entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(default_factory=datetime.now)
     level: LogLevel
     message: str
@@ -48,6 +84,8 @@ class NotificationType(str, Enum):
 class ManagerNotification(BaseModel):
     """Message to manager (written to notification file)."""
 
+    model_config = ConfigDict(frozen=True)
+
     worker_pid: int
     issue_number: int
     notification_type: NotificationType
@@ -79,6 +117,9 @@ class BaseWorkerConfig(BaseModel):
     # Common behavior configuration
     max_retries: int = 3
 
+    # Log entries below this level are dropped before any work is done
+    min_log_level: LogLevel = LogLevel.INFO
+
     # Communication channel for manager
     manager_notification_file: Path | None = None
 
@@ -99,7 +140,7 @@ class BaseWorkerStatus(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     commits: list[str] = Field(default_factory=list)
     blocked_reason: str | None = None
-    logs: list[LogEntry] = Field(default_factory=list)
+    logs: StatusLogs[LogEntry]
 
 
 class CIStatus(str, Enum):
@@ -122,6 +163,8 @@ class ReviewStatus(str, Enum):
 class ReviewComment(BaseModel):
     """A comment from a PR review."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
     line: int
     body: str
@@ -131,6 +174,8 @@ class ReviewComment(BaseModel):
 class PRReview(BaseModel):
     """GitHub PR review from Claude integration."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     state: str  # APPROVED, CHANGES_REQUESTED, COMMENTED, PENDING
     body: str
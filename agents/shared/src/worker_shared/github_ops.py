@@ -7,10 +7,11 @@ This is a shared component used by all worker types.
 
 import asyncio
 import re
-from datetime import datetime
+import time
 from typing import TYPE_CHECKING, Any
 
 from github import Github
+from github.Commit import Commit
 from github.GithubException import GithubException
 
 from .base_models import (
@@ -19,11 +20,53 @@ from .base_models import (
     PRReview,
     ReviewComment,
 )
+from .ttl_cache import ttl_cache
 
 if TYPE_CHECKING:
     from .base_status import BaseStatusManager
 
 
+# Review comment keywords that make the comment blocking
+BLOCKING_KEYWORDS_RE = re.compile(r"must|required|blocking|security", re.IGNORECASE)
+
+# Phrases in a Claude comment that mean it is asking for changes
+CHANGE_REQUEST_RE = re.compile(
+    r"fix:|issue:|bug:|error:|problem:|should|must|need to",
+    re.IGNORECASE,
+)
+
+# File references in Claude comments: [file.py:123](url)
+FILE_REF_RE = re.compile(r"\[`?([^`\]]+(?::\d+)?)`?\]")
+
+# Items per page when listing reviews, comments and check runs; GitHub's maximum,
+# so most lists arrive in one request over the client's keep-alive connection
+GITHUB_PAGE_SIZE = 100
+
+# Default seconds between polls while waiting on a review, PR CI and the main build.
+# The wait_for_* methods take poll_seconds to override them (e.g. for test runs)
+REVIEW_POLL_SECONDS = 15
+CI_POLL_SECONDS = 30
+MAIN_BUILD_POLL_SECONDS = 15
+
+# Issue details are reused for this long, so the several lookups during one
+# run cost a single request while edits to the issue are still picked up
+ISSUE_CACHE_SECONDS = 600
+
+# Login substrings identifying Claude GitHub integration
+CLAUDE_LOGIN_MARKERS = ("claude", "anthropic")
+
+
+def _is_claude_user(login: str, user_type: str) -> bool:
+    """Whether a GitHub user is Claude GitHub integration (or another bot)."""
+    login_lower = login.lower()
+    return user_type == "Bot" or any(marker in login_lower for marker in CLAUDE_LOGIN_MARKERS)
+
+
+async def sleep_until_next_poll(poll_seconds: float, deadline: float) -> None:
+    """Sleep for one poll interval, cut short at the deadline so waits don't overrun it."""
+    await asyncio.sleep(max(0.0, min(poll_seconds, deadline - time.monotonic())))
+
+
 class GitHubOperations:
     """
     Manages GitHub operations: PRs, reviews, issues, checks.
@@ -34,16 +77,25 @@ class GitHubOperations:
         github_token: str,
         repo_owner: str,
         repo_name: str,
-        status_manager: "BaseStatusManager",  # type: ignore[type-arg]
+        status_manager: "BaseStatusManager",
     ) -> None:
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.status_manager = status_manager
-        self.github = Github(github_token)
+        self.github = Github(github_token, per_page=GITHUB_PAGE_SIZE)
         self.repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
 
+    def close(self) -> None:
+        """Close the GitHub client's pooled connections."""
+        self.github.close()
+
+    @ttl_cache(ISSUE_CACHE_SECONDS)
     async def get_issue(self, issue_number: int) -> dict[str, Any]:
-        """Get issue details."""
+        """Get issue details, reusing them for up to ISSUE_CACHE_SECONDS."""
+        return await asyncio.to_thread(self._fetch_issue, issue_number)
+
+    def _fetch_issue(self, issue_number: int) -> dict[str, Any]:
+        """Fetch issue details (blocking)."""
         issue = self.repo.get_issue(issue_number)
         return {
             "title": issue.title,
@@ -108,6 +160,8 @@ class GitHubOperations:
         """Get PR reviews, filtering for Claude GitHub integration."""
         pr = self.repo.get_pull(pr_number)
         reviews = list(pr.get_reviews())
+        if not reviews:
+            return []  # Review comments always belong to a review, so skip listing them
         review_comments = list(pr.get_review_comments())
 
         result: list[PRReview] = []
@@ -118,11 +172,7 @@ class GitHubOperations:
             for comment in review_comments:
                 if comment.pull_request_review_id == review.id:
                     # Consider comment blocking if it contains certain keywords
-                    body_lower = comment.body.lower()
-                    is_blocking = any(
-                        keyword in body_lower
-                        for keyword in ["must", "required", "blocking", "security"]
-                    )
+                    is_blocking = BLOCKING_KEYWORDS_RE.search(comment.body) is not None
                     comments_for_review.append(
                         ReviewComment(
                             path=comment.path,
@@ -166,32 +216,13 @@ class GitHubOperations:
             user_type = comment.user.type if comment.user else "User"
 
             # Check if this is from Claude
-            is_claude = (
-                user_type == "Bot"
-                or "claude" in user_login.lower()
-                or "anthropic" in user_login.lower()
-            )
+            is_claude = _is_claude_user(user_login, user_type)
 
             if not is_claude:
                 continue
 
-            # Parse comment to determine if it's requesting changes
-            body_lower = comment.body.lower()
-
             # Claude comments that suggest fixes are treated as change requests
-            requests_changes = any(
-                indicator in body_lower
-                for indicator in [
-                    "fix:",
-                    "issue:",
-                    "bug:",
-                    "error:",
-                    "problem:",
-                    "should",
-                    "must",
-                    "need to",
-                ]
-            )
+            requests_changes = CHANGE_REQUEST_RE.search(comment.body) is not None
 
             # Determine state based on content
             if requests_changes:
@@ -202,7 +233,7 @@ class GitHubOperations:
             # Extract file path and line from comment if present
             # Claude format: [file.py:123](url)
             review_comments: list[ReviewComment] = []
-            file_refs = re.findall(r"\[`?([^`\]]+(?::\d+)?)`?\]", comment.body)
+            file_refs = FILE_REF_RE.findall(comment.body)
             for ref in file_refs:
                 if ":" in ref:
                     path, line_str = ref.rsplit(":", 1)
@@ -248,6 +279,7 @@ class GitHubOperations:
         pr_number: int,
         timeout_seconds: int,
         already_processed_ids: set[int] | None = None,
+        poll_seconds: float = REVIEW_POLL_SECONDS,
     ) -> PRReview | None:
         """Wait for Claude GitHub integration to review.
 
@@ -260,9 +292,9 @@ class GitHubOperations:
             timeout_seconds: How long to wait
             already_processed_ids: Set of comment IDs that have already been
                 addressed - these will be skipped to avoid re-processing
+            poll_seconds: Delay between checks
         """
-        start_time = datetime.now()
-        poll_interval = 15  # seconds
+        deadline = time.monotonic() + timeout_seconds
         skip_ids = already_processed_ids or set()
 
         self.status_manager.log(
@@ -275,17 +307,13 @@ class GitHubOperations:
                 f"Skipping {len(skip_ids)} already-processed comment(s)",
             )
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
+        while time.monotonic() < deadline:
             # Check formal PR reviews first
             reviews = await self.get_pr_reviews(pr_number)
             for review in reviews:
                 if review.id in skip_ids:
                     continue
-                is_claude = (
-                    review.user_type == "Bot"
-                    or "claude" in review.user_login.lower()
-                    or "anthropic" in review.user_login.lower()
-                )
+                is_claude = _is_claude_user(review.user_login, review.user_type)
                 if is_claude and review.state != "PENDING":
                     self.status_manager.log(
                         LogLevel.INFO,
@@ -306,9 +334,9 @@ class GitHubOperations:
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"No new Claude feedback yet, polling in {poll_interval}s...",
+                f"No new Claude feedback yet, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -316,16 +344,21 @@ class GitHubOperations:
         )
         return None
 
-    async def get_pr_check_status(self, pr_number: int) -> CIStatus:
-        """Get PR check status (CI)."""
-        pr = self.repo.get_pull(pr_number)
-        head_sha = pr.head.sha
+    async def get_pr_check_status(
+        self, pr_number: int, head_commit: Commit | None = None
+    ) -> CIStatus:
+        """Get PR check status (CI).
+
+        Pass the PR's head commit when checking it repeatedly, to skip looking it up again.
+        """
+        if head_commit is None:
+            head_commit = self._get_pr_head_commit(pr_number)
 
         # Get combined status
-        combined_status = self.repo.get_commit(head_sha).get_combined_status()
+        combined_status = head_commit.get_combined_status()
 
         # Get check runs (GitHub Actions)
-        check_runs = list(self.repo.get_commit(head_sha).get_check_runs())
+        check_runs = list(head_commit.get_check_runs())
 
         # Check if there are no CI checks configured
         statuses = list(combined_status.statuses)
@@ -351,15 +384,25 @@ class GitHubOperations:
 
         return CIStatus.PENDING
 
-    async def wait_for_ci(self, pr_number: int, timeout_seconds: int) -> CIStatus:
+    def _get_pr_head_commit(self, pr_number: int) -> Commit:
+        """Get the head commit of a PR."""
+        pr = self.repo.get_pull(pr_number)
+        return self.repo.get_commit(pr.head.sha)
+
+    async def wait_for_ci(
+        self, pr_number: int, timeout_seconds: int, poll_seconds: float = CI_POLL_SECONDS
+    ) -> CIStatus:
         """Wait for CI checks to complete."""
-        start_time = datetime.now()
-        poll_interval = 30  # seconds
+        deadline = time.monotonic() + timeout_seconds
 
         self.status_manager.log(LogLevel.INFO, f"Waiting for CI checks on PR #{pr_number}")
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
-            status = await self.get_pr_check_status(pr_number)
+        # Nothing is pushed while waiting, so the head is looked up once and each
+        # poll only fetches its check state
+        head_commit = self._get_pr_head_commit(pr_number)
+
+        while time.monotonic() < deadline:
+            status = await self.get_pr_check_status(pr_number, head_commit)
 
             if status == CIStatus.SUCCESS:
                 self.status_manager.log(LogLevel.INFO, "CI checks passed")
@@ -371,9 +414,9 @@ class GitHubOperations:
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"CI still pending, polling in {poll_interval}s...",
+                f"CI still pending, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -381,17 +424,18 @@ class GitHubOperations:
         )
         return CIStatus.FAILURE
 
-    async def wait_for_main_branch_build(self, timeout_seconds: int) -> CIStatus:
+    async def wait_for_main_branch_build(
+        self, timeout_seconds: int, poll_seconds: float = MAIN_BUILD_POLL_SECONDS
+    ) -> CIStatus:
         """Wait for main branch build to complete after merge."""
-        start_time = datetime.now()
-        poll_interval = 15  # seconds
+        deadline = time.monotonic() + timeout_seconds
 
         self.status_manager.log(LogLevel.INFO, "Waiting for main branch build...")
 
         # Get the latest commit on main
         main_branch = self.repo.get_branch("main")
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
+        while time.monotonic() < deadline:
             # Get check runs for main
             check_runs = list(main_branch.commit.get_check_runs())
             combined_status = main_branch.commit.get_combined_status()
@@ -414,9 +458,9 @@ class GitHubOperations:
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"Main build still pending, polling in {poll_interval}s...",
+                f"Main build still pending, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -0,0 +1,24 @@
+"""
+File writes used to persist worker status.
+"""
+
+import os
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers never see a partial write.
+
+    The data goes to a temporary file beside it (status.json -> status.json.tmp),
+    which is then renamed over the original.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def append_bytes(path: Path, data: bytes) -> None:
+    """Append to a file, skipping the open if there's nothing to write."""
+    if data:
+        with path.open("ab") as f:
+            f.write(data)
@@ -0,0 +1,122 @@
+"""
+Time-limited memoization for async read paths.
+
+Used in front of GitHub API lookups whose results don't need to be fresher than
+a known interval, so repeated calls within that interval cost no requests.
+"""
+
+import asyncio
+import functools
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+R = TypeVar("R")
+
+
+class _Store(Generic[R]):
+    """Cached results and in-flight calls, per positional arguments."""
+
+    __slots__ = ("entries", "pending")
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[Hashable, ...], tuple[R, float]] = {}
+        self.pending: dict[tuple[Hashable, ...], asyncio.Future[R]] = {}
+
+
+class TTLCache(Generic[R]):
+    """
+    Caches an async function's results per positional arguments for `seconds`.
+
+    Concurrent calls with the same arguments share a single underlying call.
+    Works on methods too; each instance then has its own cache, which goes away
+    with the instance.
+    """
+
+    def __init__(self, func: Callable[..., Awaitable[R]], seconds: float) -> None:
+        self._func = func
+        self._seconds = seconds
+        self._store: _Store[R] = _Store()
+        self._instance_stores: weakref.WeakKeyDictionary[Any, _Store[R]] = (
+            weakref.WeakKeyDictionary()
+        )
+        functools.update_wrapper(self, func)
+
+    async def __call__(self, *args: Hashable) -> R:
+        return await self._call(self._store, args, args)
+
+    def __get__(self, instance: object, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        store = self._instance_stores.get(instance)
+        if store is None:
+            store = self._instance_stores[instance] = _Store()
+        return BoundTTLCache(self, instance, store)
+
+    def invalidate(self, *args: Hashable) -> None:
+        """Drop the cached result for these arguments."""
+        self._store.entries.pop(args, None)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._store.entries.clear()
+
+    async def _call(self, store: _Store[R], key: tuple[Hashable, ...], args: tuple[Any, ...]) -> R:
+        """Return the cached result for key, or join or start the call that fills it."""
+        entry = store.entries.get(key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                return entry[0]
+            del store.entries[key]
+
+        pending = store.pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._func(*args))
+            store.pending[key] = pending
+            pending.add_done_callback(functools.partial(self._fill, store, key))
+        # Shielded so a cancelled caller doesn't cancel the call other callers share
+        return await asyncio.shield(pending)
+
+    def _fill(self, store: _Store[R], key: tuple[Hashable, ...], call: asyncio.Future[R]) -> None:
+        """Cache a finished call's result; failures aren't cached."""
+        del store.pending[key]
+        if call.cancelled() or call.exception() is not None:
+            return
+        now = time.monotonic()
+        # Sweep expired entries here, so results that are never asked for again
+        # don't accumulate
+        for expired in [k for k, (_, expires) in store.entries.items() if expires <= now]:
+            del store.entries[expired]
+        store.entries[key] = (call.result(), now + self._seconds)
+
+
+class BoundTTLCache(Generic[R]):
+    """A TTLCache'd method bound to an instance, with that instance's cache."""
+
+    __slots__ = ("_cache", "_instance", "_store")
+
+    def __init__(self, cache: TTLCache[R], instance: object, store: _Store[R]) -> None:
+        self._cache = cache
+        self._instance = instance
+        self._store = store
+
+    async def __call__(self, *args: Hashable) -> R:
+        return await self._cache._call(self._store, args, (self._instance, *args))
+
+    def invalidate(self, *args: Hashable) -> None:
+        """Drop this instance's cached result for these arguments."""
+        self._store.entries.pop(args, None)
+
+    def clear(self) -> None:
+        """Drop all of this instance's cached results."""
+        self._store.entries.clear()
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[..., Awaitable[R]]], TTLCache[R]]:
+    """Decorator form of TTLCache."""
+
+    def decorator(func: Callable[..., Awaitable[R]]) -> TTLCache[R]:
+        return TTLCache(func, seconds)
+
+    return decorator
@@ -3,8 +3,14 @@ Main worker agent implementation using Claude Agent SDK.
 Handles full PR lifecycle from issue to merge to main branch verification.
 """
 
+import asyncio
+import contextlib
+import traceback
+from collections.abc import AsyncIterator
+from pathlib import Path
+
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
-from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
+from claude_agent_sdk.types import AssistantMessage, Message, ResultMessage, TextBlock
 
 from .git_manager import GitManager
 from .github_manager import GitHubManager
@@ -12,11 +18,74 @@ from .models import (
     CIStatus,
     LogLevel,
     NotificationType,
+    ReviewComment,
     WorkerConfig,
     WorkerPhase,
 )
 from .status_manager import StatusManager
 
+# Tools for the Claude session shared by every step
+CLAUDE_ALLOWED_TOOLS = ["Read", "Write", "Edit", "Glob", "Grep", "Bash"]
+
+# Turn limit for each step. The session's own limit is the largest of them; the
+# smaller ones are enforced by _run_claude
+IMPLEMENT_MAX_TURNS = 50
+FIX_VALIDATION_MAX_TURNS = 20
+ADDRESS_FEEDBACK_MAX_TURNS = 30
+FIX_CI_MAX_TURNS = 20
+CLAUDE_MAX_TURNS = max(
+    IMPLEMENT_MAX_TURNS, FIX_VALIDATION_MAX_TURNS, ADDRESS_FEEDBACK_MAX_TURNS, FIX_CI_MAX_TURNS
+)
+
+# Phases after which the worktree is no longer needed
+WORKTREE_CLEANUP_PHASES = frozenset({WorkerPhase.COMPLETED, WorkerPhase.FAILED})
+
+# Prompts sent to Claude for each step; placeholders are filled with str.format_map
+IMPLEMENT_PROMPT = """You are implementing a feature for a GitHub issue.
+
+## Issue #{issue_number}: {title}
+
+{body}
+
+## Instructions
+
+1. Read the existing codebase to understand the structure and patterns
+2. Implement the feature described in the issue
+3. Write or update tests for the new functionality
+4. Commit your changes frequently with descriptive messages
+5. Do NOT modify lint, typecheck, or test configuration unless absolutely necessary
+   - If you believe config changes are needed, explain why but do NOT make them
+6. Follow existing code style and patterns
+
+Work in the current directory. Make incremental progress and commit often."""
+
+FIX_VALIDATION_PROMPT = """Validation (lint/typecheck/test) failed. Please:
+
+1. Read the error output from the validation commands
+2. Fix the issues in the code
+3. Do NOT modify lint, typecheck, or test configuration
+4. Run the validation again to verify fixes
+
+If you cannot fix the issues without config changes, explain why."""
+
+ADDRESS_FEEDBACK_PROMPT = """The code review requested changes. Please fix this issue:
+
+{feedback}
+
+Files to modify:
+{files}
+
+Read the relevant files, make the necessary fixes, and ensure tests still pass."""
+
+FIX_CI_PROMPT = """CI checks failed. Please:
+
+1. Check the GitHub Actions output (use gh CLI if needed)
+2. Identify what failed
+3. Fix the issues in the code
+4. Do NOT modify CI configuration unless absolutely necessary
+
+Commit your fixes."""
+
 
 class WorkerAgent:
     """
@@ -42,6 +111,9 @@ class WorkerAgent:
         self.git_manager: GitManager | None = None
         self.github_manager: GitHubManager | None = None
 
+        # One Claude session shared by every step of the run, connected on first use
+        self._claude: ClaudeSDKClient | None = None
+
     async def run(self) -> bool:
         """
         Run the full worker agent lifecycle.
@@ -64,6 +136,7 @@ class WorkerAgent:
             self.config.worktree_base_dir,
             self.issue_number,
             self.status_manager,
+            sparse_paths=self.config.sparse_paths,
         )
 
         self.github_manager = GitHubManager(self.config, self.status_manager)
@@ -124,22 +197,34 @@ class WorkerAgent:
                     if review.state == "CHANGES_REQUESTED":
                         # Address blocking feedback
                         await self.status_manager.set_phase(WorkerPhase.ADDRESSING_FEEDBACK)
-                        blocking_comments = [c for c in review.comments if c.is_blocking]
-                        non_blocking_comments = [c for c in review.comments if not c.is_blocking]
-
-                        # Create issues for non-blocking feedback
-                        for comment in non_blocking_comments:
-                            await self.github_manager.create_issue_from_feedback(
-                                self.issue_number,
-                                pr_number,
-                                comment,
-                            )
-
-                        # Fix blocking issues
-                        if blocking_comments:
-                            fixed = await self._address_review_feedback(blocking_comments)
-                            if not fixed:
-                                continue  # Try again next iteration
+                        blocking_comments: list[ReviewComment] = []
+                        non_blocking_comments: list[ReviewComment] = []
+                        for c in review.comments:
+                            if c.is_blocking:
+                                blocking_comments.append(c)
+                            else:
+                                non_blocking_comments.append(c)
+
+                        # Create issues for non-blocking feedback while the blocking
+                        # feedback is fixed; neither depends on the other. Both finish
+                        # before a failure in either is raised, so neither outlives
+                        # this step
+                        fix = (
+                            self._address_review_feedback(blocking_comments)
+                            if blocking_comments
+                            else asyncio.sleep(0, result=True)  # Nothing blocking to fix
+                        )
+                        filed, fixed = await asyncio.gather(
+                            self._create_follow_up_issues(pr_number, non_blocking_comments),
+                            fix,
+                            return_exceptions=True,
+                        )
+                        if isinstance(fixed, BaseException):
+                            raise fixed
+                        if isinstance(filed, BaseException):
+                            raise filed
+                        if not fixed:
+                            continue  # Try again next iteration
 
                         # Push fixes
                         await self.git_manager.push()
@@ -208,8 +293,9 @@ class WorkerAgent:
                     return False
 
                 # Success!
-                await self.status_manager.set_main_branch_verified(True)
-                await self.status_manager.set_phase(WorkerPhase.COMPLETED)
+                async with self.status_manager.batch():
+                    await self.status_manager.set_main_branch_verified(True)
+                    await self.status_manager.set_phase(WorkerPhase.COMPLETED)
                 await self.status_manager.notify_manager(
                     NotificationType.COMPLETED,
                     f"Successfully merged PR #{pr_number} for issue #{self.issue_number}. Main branch build verified.",
@@ -232,10 +318,68 @@ class WorkerAgent:
             raise
         finally:
             # Cleanup worktree on completion
-            if self.git_manager and self.status_manager:
-                status = self.status_manager.get_status()
-                if status.phase in (WorkerPhase.COMPLETED, WorkerPhase.FAILED):
-                    await self.git_manager.cleanup()
+            if (
+                self.git_manager
+                and self.status_manager
+                and self.status_manager.status.phase in WORKTREE_CLEANUP_PHASES
+            ):
+                await self.git_manager.cleanup()
+            await self._close_claude_client()
+            if self.github_manager:
+                self.github_manager.close()
+            await self.status_manager.close()
+
+    async def _get_claude_client(self) -> ClaudeSDKClient:
+        """Get the run's Claude client, connecting it on first use."""
+        if self._claude is None:
+            if not self.git_manager:
+                raise RuntimeError("Worktree must be initialized before starting Claude")
+            client = ClaudeSDKClient(
+                options=ClaudeAgentOptions(
+                    allowed_tools=CLAUDE_ALLOWED_TOOLS,
+                    permission_mode="acceptEdits",
+                    cwd=str(self.git_manager.get_worktree_path()),
+                    max_turns=CLAUDE_MAX_TURNS,
+                )
+            )
+            await client.connect()
+            self._claude = client
+        return self._claude
+
+    async def _run_claude(self, prompt: str, max_turns: int) -> AsyncIterator[Message]:
+        """Send a prompt on the shared Claude session and stream the response.
+
+        If Claude starts more than max_turns turns, the request is interrupted and
+        RuntimeError is raised once the interrupted response has ended.
+        """
+        client = await self._get_claude_client()
+        await client.query(prompt)
+
+        # A turn's content can arrive as several messages sharing its message ID;
+        # messages from subagents (parent_tool_use_id set) aren't turns of this step
+        turns = 0
+        turn_id: str | None = None
+        interrupted = False
+        async for message in client.receive_response():
+            if isinstance(message, AssistantMessage) and message.parent_tool_use_id is None:
+                if message.message_id is None or message.message_id != turn_id:
+                    turns += 1
+                    turn_id = message.message_id
+                if turns > max_turns and not interrupted:
+                    await client.interrupt()
+                    interrupted = True
+            if interrupted:
+                continue  # Drain the rest so the session can take the next request
+            yield message
+        if interrupted:
+            raise RuntimeError(f"Claude exceeded the step's limit of {max_turns} turns")
+
+    async def _close_claude_client(self) -> None:
+        """Disconnect the Claude client, if connected; the next step reconnects."""
+        client, self._claude = self._claude, None
+        if client is not None:
+            with contextlib.suppress(Exception):
+                await client.disconnect()
 
     async def _implement_feature(self) -> bool:
         """Use Claude Agent SDK to implement the feature."""
@@ -244,51 +388,28 @@ class WorkerAgent:
 
         # Get issue details
         issue = await self.github_manager.get_issue(self.issue_number)
-        worktree_path = self.git_manager.get_worktree_path()
 
-        prompt = f"""You are implementing a feature for a GitHub issue.
-
-## Issue #{self.issue_number}: {issue['title']}
-
-{issue['body']}
-
-## Instructions
-
-1. Read the existing codebase to understand the structure and patterns
-2. Implement the feature described in the issue
-3. Write or update tests for the new functionality
-4. Commit your changes frequently with descriptive messages
-5. Do NOT modify lint, typecheck, or test configuration unless absolutely necessary
-   - If you believe config changes are needed, explain why but do NOT make them
-6. Follow existing code style and patterns
-
-Work in the current directory. Make incremental progress and commit often."""
-
-        options = ClaudeAgentOptions(
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash"],
-            permission_mode="acceptEdits",
-            cwd=str(worktree_path),
-            max_turns=50,
+        prompt = IMPLEMENT_PROMPT.format_map(
+            {"issue_number": self.issue_number, "title": issue["title"], "body": issue["body"]}
         )
 
         try:
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                # Log Claude's progress
-                                text = block.text[:200] + "..." if len(block.text) > 200 else block.text
-                                self.status_manager.log(LogLevel.DEBUG, f"Claude: {text}")
-
-                    if isinstance(message, ResultMessage) and message.is_error:
-                        self.status_manager.log(
-                            LogLevel.ERROR,
-                            f"Claude failed: {message.result}",
-                        )
-                        return False
+            log_progress = self.status_manager.is_logged(LogLevel.DEBUG)
+
+            async for message in self._run_claude(prompt, IMPLEMENT_MAX_TURNS):
+                if log_progress and isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            # Log Claude's progress
+                            text = block.text[:200] + "..." if len(block.text) > 200 else block.text
+                            self.status_manager.log(LogLevel.DEBUG, f"Claude: {text}")
+
+                if isinstance(message, ResultMessage) and message.is_error:
+                    self.status_manager.log(
+                        LogLevel.ERROR,
+                        f"Claude failed: {message.result}",
+                    )
+                    return False
 
             # Commit any remaining changes
             await self.git_manager.commit(f"Implement feature for issue #{self.issue_number}")
@@ -296,6 +417,7 @@ Work in the current directory. Make incremental progress and commit often."""
             return True
 
         except Exception as e:
+            await self._close_claude_client()  # Don't reuse a session left mid-response
             self.status_manager.log(LogLevel.ERROR, f"Claude SDK error: {e}")
             return False
 
@@ -310,84 +432,78 @@ Work in the current directory. Make incremental progress and commit often."""
         package_json = worktree_path / "package.json"
         pyproject = worktree_path / "pyproject.toml"
 
-        commands: list[tuple[str, str]] = []
+        commands: list[tuple[str, tuple[str, ...]]] = []
 
         if package_json.exists():
             # Node.js project
             commands = [
-                ("lint", "npm run lint"),
-                ("typecheck", "npm run typecheck"),
-                ("test", "npm test -- --run"),
+                ("lint", ("npm", "run", "lint")),
+                ("typecheck", ("npm", "run", "typecheck")),
+                ("test", ("npm", "test", "--", "--run")),
             ]
         elif pyproject.exists():
             # Python project
             commands = [
-                ("lint", "uv run ruff check ."),
-                ("typecheck", "uv run mypy ."),
-                ("test", "uv run pytest"),
+                ("lint", ("uv", "run", "ruff", "check", ".")),
+                ("typecheck", ("uv", "run", "mypy", ".")),
+                ("test", ("uv", "run", "pytest")),
             ]
 
-        all_passed = True
-        for name, cmd in commands:
-            self.status_manager.log(LogLevel.INFO, f"Running {name}...")
-            try:
-                import subprocess
-
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
-                if result.returncode != 0:
-                    self.status_manager.log(
-                        LogLevel.WARN,
-                        f"{name} failed: {result.stderr[:500]}",
-                    )
-                    all_passed = False
-                else:
-                    self.status_manager.log(LogLevel.INFO, f"{name} passed")
-            except Exception as e:
-                self.status_manager.log(LogLevel.ERROR, f"{name} error: {e}")
-                all_passed = False
+        # The checks don't depend on each other, so run them all at once
+        results = await asyncio.gather(
+            *(self._run_check(name, args, worktree_path) for name, args in commands)
+        )
+        return all(results)
+
+    async def _run_check(self, name: str, args: tuple[str, ...], cwd: Path) -> bool:
+        """Run one validation command and log the outcome. Returns whether it passed."""
+        if not self.status_manager:
+            return False
 
-        return all_passed
+        self.status_manager.log(LogLevel.INFO, f"Running {name}...")
+        try:
+            returncode, stderr = await self._run_process(*args, cwd=cwd, timeout_seconds=300)
+        except Exception as e:
+            self.status_manager.log(LogLevel.ERROR, f"{name} error: {e}")
+            return False
+        if returncode != 0:
+            self.status_manager.log(LogLevel.WARN, f"{name} failed: {stderr[:500]}")
+            return False
+        self.status_manager.log(LogLevel.INFO, f"{name} passed")
+        return True
+
+    async def _run_process(self, *args: str, cwd: Path, timeout_seconds: float) -> tuple[int, str]:
+        """Run a command without a shell or blocking the event loop. Returns (returncode, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_seconds)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TimeoutError(
+                f"{' '.join(args)!r} timed out after {timeout_seconds:g} seconds"
+            ) from None
+        return proc.returncode or 0, stderr.decode("utf-8", errors="replace")
 
     async def _fix_validation_issues(self) -> bool:
         """Use Claude to fix validation issues."""
         if not self.git_manager or not self.status_manager:
             return False
 
-        worktree_path = self.git_manager.get_worktree_path()
-
-        prompt = """Validation (lint/typecheck/test) failed. Please:
-
-1. Read the error output from the validation commands
-2. Fix the issues in the code
-3. Do NOT modify lint, typecheck, or test configuration
-4. Run the validation again to verify fixes
-
-If you cannot fix the issues without config changes, explain why."""
-
-        options = ClaudeAgentOptions(
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash"],
-            permission_mode="acceptEdits",
-            cwd=str(worktree_path),
-            max_turns=20,
-        )
-
         try:
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-                async for message in client.receive_response():
-                    if isinstance(message, ResultMessage) and message.is_error:
-                        return False
+            async for message in self._run_claude(FIX_VALIDATION_PROMPT, FIX_VALIDATION_MAX_TURNS):
+                if isinstance(message, ResultMessage) and message.is_error:
+                    return False
 
             await self.git_manager.commit("Fix validation issues")
             return await self._validate()  # Re-run validation
         except Exception as e:
+            await self._close_claude_client()  # Don't reuse a session left mid-response
             self.status_manager.log(LogLevel.ERROR, f"Failed to fix validation: {e}")
             return False
 
@@ -405,20 +521,39 @@ If you cannot fix the issues without config changes, explain why."""
             body=f"Implementation for issue #{self.issue_number}\n\n{issue['body']}",
         )
 
+    async def _create_follow_up_issues(self, pr_number: int, comments: list[ReviewComment]) -> None:
+        """Create an issue for each non-blocking review comment."""
+        if not self.github_manager or not self.status_manager:
+            return
+
+        # One at a time: GitHub rate-limits concurrent content creation. A comment
+        # citing the same location twice yields identical entries, which are filed
+        # once (dict.fromkeys keeps order; ReviewComment is hashable)
+        created: list[int] = []
+        try:
+            for comment in dict.fromkeys(comments):
+                created.append(
+                    await self.github_manager.create_issue_from_feedback(
+                        self.issue_number,
+                        pr_number,
+                        comment,
+                    )
+                )
+        finally:
+            # Recorded together in one status write, including those filed before a
+            # failure. Only this block is batched: the feedback fix runs alongside,
+            # and its status updates mustn't wait on the API calls
+            async with self.status_manager.batch():
+                for issue_number in created:
+                    await self.status_manager.add_created_issue(issue_number)
+
     async def _address_review_feedback(self, comments: list) -> bool:
         """Use Claude to address review feedback."""
         if not self.git_manager or not self.status_manager:
             return False
 
-        worktree_path = self.git_manager.get_worktree_path()
-
-        # Build focused feedback text with just the actionable items
-        feedback_items = []
-        for c in comments:
-            # Extract just the key info, not the full body
-            feedback_items.append(f"- File: {c.path}, Line: {c.line}")
-
-        feedback_text = "\n".join(feedback_items)
+        # Build focused feedback text with just the key info, not the full body
+        feedback_text = "\n".join(f"- File: {c.path}, Line: {c.line}" for c in comments)
 
         # Get the full body from the first comment for context
         full_feedback = comments[0].body if comments else ""
@@ -428,43 +563,31 @@ If you cannot fix the issues without config changes, explain why."""
             f"Addressing {len(comments)} blocking comments",
         )
 
-        prompt = f"""The code review requested changes. Please fix this issue:
-
-{full_feedback}
-
-Files to modify:
-{feedback_text}
-
-Read the relevant files, make the necessary fixes, and ensure tests still pass."""
-
-        self.status_manager.log(LogLevel.DEBUG, f"Feedback prompt: {prompt[:200]}...")
-
-        options = ClaudeAgentOptions(
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash"],
-            permission_mode="acceptEdits",
-            cwd=str(worktree_path),
-            max_turns=30,
+        prompt = ADDRESS_FEEDBACK_PROMPT.format_map(
+            {"feedback": full_feedback, "files": feedback_text}
         )
 
+        log_progress = self.status_manager.is_logged(LogLevel.DEBUG)
+        if log_progress:
+            self.status_manager.log(LogLevel.DEBUG, f"Feedback prompt: {prompt[:200]}...")
+
         try:
             self.status_manager.log(LogLevel.INFO, "Starting Claude SDK for feedback fix...")
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        # Log Claude's progress
-                        text = ""
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                text = block.text[:100]
-                                break
-                        if text:
-                            self.status_manager.log(LogLevel.DEBUG, f"Claude: {text}...")
-                    if isinstance(message, ResultMessage):
-                        if message.is_error:
-                            self.status_manager.log(LogLevel.ERROR, f"Claude SDK error: {message.result}")
-                            return False
-                        self.status_manager.log(LogLevel.INFO, f"Claude completed feedback fix in {message.num_turns} turns")
+            async for message in self._run_claude(prompt, ADDRESS_FEEDBACK_MAX_TURNS):
+                if log_progress and isinstance(message, AssistantMessage):
+                    # Log Claude's progress
+                    text = ""
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            text = block.text[:100]
+                            break
+                    if text:
+                        self.status_manager.log(LogLevel.DEBUG, f"Claude: {text}...")
+                if isinstance(message, ResultMessage):
+                    if message.is_error:
+                        self.status_manager.log(LogLevel.ERROR, f"Claude SDK error: {message.result}")
+                        return False
+                    self.status_manager.log(LogLevel.INFO, f"Claude completed feedback fix in {message.num_turns} turns")
 
             sha = await self.git_manager.commit("Address review feedback")
             if sha:
@@ -473,9 +596,11 @@ Read the relevant files, make the necessary fixes, and ensure tests still pass."
                 self.status_manager.log(LogLevel.WARN, "No changes made by Claude for feedback")
             return True
         except Exception as e:
-            self.status_manager.log(LogLevel.ERROR, f"Failed to address feedback: {e}")
-            import traceback
-            self.status_manager.log(LogLevel.ERROR, traceback.format_exc())
+            await self._close_claude_client()  # Don't reuse a session left mid-response
+            # Traceback goes in the same entry so the failure reads as one record
+            self.status_manager.log(
+                LogLevel.ERROR, f"Failed to address feedback: {e}\n{traceback.format_exc()}"
+            )
             return False
 
     async def _fix_ci_failures(self) -> bool:
@@ -483,33 +608,14 @@ Read the relevant files, make the necessary fixes, and ensure tests still pass."
         if not self.git_manager or not self.status_manager:
             return False
 
-        worktree_path = self.git_manager.get_worktree_path()
-
-        prompt = """CI checks failed. Please:
-
-1. Check the GitHub Actions output (use gh CLI if needed)
-2. Identify what failed
-3. Fix the issues in the code
-4. Do NOT modify CI configuration unless absolutely necessary
-
-Commit your fixes."""
-
-        options = ClaudeAgentOptions(
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash"],
-            permission_mode="acceptEdits",
-            cwd=str(worktree_path),
-            max_turns=20,
-        )
-
         try:
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-                async for message in client.receive_response():
-                    if isinstance(message, ResultMessage) and message.is_error:
-                        return False
+            async for message in self._run_claude(FIX_CI_PROMPT, FIX_CI_MAX_TURNS):
+                if isinstance(message, ResultMessage) and message.is_error:
+                    return False
 
             await self.git_manager.commit("Fix CI failures")
             return True
         except Exception as e:
+            await self._close_claude_client()  # Don't reuse a session left mid-response
             self.status_manager.log(LogLevel.ERROR, f"Failed to fix CI: {e}")
             return False
@@ -2,22 +2,31 @@
 CLI for worker agent.
 """
 
-import asyncio
+import mmap
 import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import orjson
 import typer
-from dotenv import load_dotenv
-from rich.console import Console
 
-from .agent import WorkerAgent
-from .models import WorkerConfig
+from .models import COMMITS_FILE_NAME, LOGS_FILE_NAME, STATUS_DB_NAME, STATUS_FILE_NAME, LogLevel
 
 app = typer.Typer(
     name="worker-agent",
     help="Autonomous worker agent for PR lifecycle management",
 )
-console = Console()
+
+# Status files are read concurrently; reads are latency-bound on network filesystems
+STATUS_READ_WORKERS = 16
+
+# `status` and `list-workers` print with typer's (click's) ANSI styling rather than
+# rich: they're run often, and importing rich would dominate their startup.
+# Colors by log level and by final phase:
+_LOG_LEVEL_COLORS = {"debug": "bright_black", "info": "blue", "warn": "yellow", "error": "red"}
+_PHASE_COLORS = {"completed": "green", "failed": "red", "blocked": "yellow"}
 
 
 @app.command()
@@ -42,6 +51,11 @@ def run(
         "-w",
         help="Directory for git worktrees",
     ),
+    sparse_paths: list[str] | None = typer.Option(
+        None,
+        "--sparse-path",
+        help="Directory to check out in the worktree (repeatable); default is the whole repo",
+    ),
     status_dir: Path = typer.Option(
         Path.cwd() / ".worker-status",
         "--status-dir",
@@ -52,7 +66,7 @@ def run(
         None,
         "--notification-file",
         "-n",
-        help="File for manager notifications",
+        help="File for manager notifications (JSON Lines, appended)",
     ),
     auto_merge: bool = typer.Option(
         False,
@@ -64,6 +78,12 @@ def run(
         "--coverage-threshold",
         help="Minimum code coverage percentage",
     ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.INFO,
+        "--log-level",
+        help="Lowest log level to print and record",
+        case_sensitive=False,
+    ),
 ) -> None:
     """
     Run the worker agent to implement a GitHub issue.
@@ -78,7 +98,17 @@ def run(
     7. Merge when approved and CI passes
     8. Verify main branch build succeeds
     """
+    # Deferred so `status` and `list-workers` don't import the Claude SDK and PyGithub
+    import asyncio
+
+    from dotenv import load_dotenv
+    from rich.console import Console
+
+    from .agent import WorkerAgent
+    from .models import WorkerConfig
+
     load_dotenv()
+    console = Console()
 
     # Parse repo
     parts = repo.split("/")
@@ -94,16 +124,20 @@ def run(
         console.print("[red]GITHUB_TOKEN environment variable required[/red]")
         raise typer.Exit(1)
 
+    # absolute() only joins with the cwd; unlike resolve() it doesn't lstat each
+    # path component, and the workers don't rely on symlinks being resolved
     config = WorkerConfig(
         github_token=github_token,
         repo_owner=repo_owner,
         repo_name=repo_name,
-        base_dir=base_dir.resolve(),
-        worktree_base_dir=worktree_dir.resolve(),
-        status_dir=status_dir.resolve(),
-        manager_notification_file=notification_file.resolve() if notification_file else None,
+        base_dir=base_dir.absolute(),
+        worktree_base_dir=worktree_dir.absolute(),
+        sparse_paths=sparse_paths or None,
+        status_dir=status_dir.absolute(),
+        manager_notification_file=notification_file.absolute() if notification_file else None,
         auto_merge=auto_merge,
         coverage_threshold=coverage_threshold,
+        min_log_level=log_level,
     )
 
     console.print(f"[bold blue]Starting worker agent for issue #{issue_number}[/bold blue]")
@@ -140,45 +174,55 @@ def status(
     ),
 ) -> None:
     """Check the status of a running or completed worker agent."""
-    import json
+    status_file = status_dir / STATUS_FILE_NAME.format(issue_number=issue_number)
 
-    status_file = status_dir / f"worker-{issue_number}.json"
-
-    if not status_file.exists():
-        console.print(f"[yellow]No status file found for issue #{issue_number}[/yellow]")
-        raise typer.Exit(1)
-
-    data = json.loads(status_file.read_text())
-
-    console.print(f"[bold]Worker Status for Issue #{issue_number}[/bold]")
-    console.print(f"PID: {data['pid']}")
-    console.print(f"Phase: {data['phase']}")
-    console.print(f"Branch: {data['branch']}")
-    console.print(f"Started: {data['started_at']}")
-    console.print(f"Updated: {data['updated_at']}")
+    # Read directly rather than checking exists() first: one less syscall, and no
+    # window where the file is replaced between the check and the read
+    try:
+        data = orjson.loads(status_file.read_bytes())
+    except FileNotFoundError:
+        typer.secho(f"No status file found for issue #{issue_number}", fg="yellow")
+        raise typer.Exit(1) from None
+
+    typer.secho(f"Worker Status for Issue #{issue_number}", bold=True)
+    typer.echo(f"PID: {data['pid']}")
+    typer.echo(f"Phase: {data['phase']}")
+    typer.echo(f"Branch: {data['branch']}")
+    typer.echo(f"Started: {data['started_at']}")
+    typer.echo(f"Updated: {data['updated_at']}")
 
     if data.get("pr_number"):
-        console.print(f"PR: #{data['pr_number']} - {data.get('pr_url', '')}")
+        typer.echo(f"PR: #{data['pr_number']} - {data.get('pr_url', '')}")
 
     if data.get("review_status"):
-        console.print(f"Review: {data['review_status']}")
+        typer.echo(f"Review: {data['review_status']}")
 
     if data.get("ci_status"):
-        console.print(f"CI: {data['ci_status']}")
+        typer.echo(f"CI: {data['ci_status']}")
 
     if data.get("blocked_reason"):
-        console.print(f"[red]Blocked: {data['blocked_reason']}[/red]")
+        typer.secho(f"Blocked: {data['blocked_reason']}", fg="red")
 
-    console.print(f"Commits: {len(data.get('commits', []))}")
-    console.print(f"Created Issues: {data.get('created_issues', [])}")
+    commits_file = status_dir / COMMITS_FILE_NAME.format(issue_number=issue_number)
+    try:
+        commit_count = commits_file.read_bytes().count(b"\n")
+    except FileNotFoundError:
+        commit_count = len(data.get("commits", []))  # Status written before commits were split out
+    typer.echo(f"Commits: {commit_count}")
+    typer.echo(f"Created Issues: {data.get('created_issues', [])}")
 
     # Show recent logs
-    logs = data.get("logs", [])[-10:]
+    logs_file = status_dir / LOGS_FILE_NAME.format(issue_number=issue_number)
+    try:
+        logs = _read_log_tail(logs_file, 10)
+    except FileNotFoundError:
+        logs = data.get("logs", [])[-10:]  # Status written before logs were split out
     if logs:
-        console.print("\n[bold]Recent Logs:[/bold]")
+        typer.secho("\nRecent Logs:", bold=True)
         for log in logs:
-            style = {"debug": "dim", "info": "blue", "warn": "yellow", "error": "red"}
-            console.print(f"  [{log['level']}] {log['message']}", style=style.get(log["level"]))
+            typer.secho(
+                f"  [{log['level']}] {log['message']}", fg=_LOG_LEVEL_COLORS.get(log["level"])
+            )
 
 
 @app.command()
@@ -191,37 +235,120 @@ def list_workers(
     ),
 ) -> None:
     """List all worker agent status files."""
-    import json
+    try:
+        status_files = _find_status_files(status_dir, "worker-")
+    except FileNotFoundError:
+        typer.secho("No status directory found", fg="yellow")
+        raise typer.Exit(0) from None
 
-    if not status_dir.exists():
-        console.print("[yellow]No status directory found[/yellow]")
+    if not status_files:
+        typer.secho("No worker status files found", fg="yellow")
         raise typer.Exit(0)
 
-    status_files = list(status_dir.glob("worker-*.json"))
+    # Workers in the status index are listed from one query. The rest (started before
+    # the index existed, or whose last index update failed) have their status file
+    # read; rows without a status file are left out
+    rows = _read_status_index(status_dir / STATUS_DB_NAME) or {}
+    unindexed = [sf for sf in status_files if _issue_number(sf) not in rows]
+
+    typer.secho("Worker Agents:", bold=True)
+
+    with ThreadPoolExecutor(max_workers=min(STATUS_READ_WORKERS, len(unindexed) or 1)) as ex:
+        # Print each row as soon as its file (and those before it) is read,
+        # rather than waiting for the whole directory
+        unindexed_data = ex.map(_read_status_file, unindexed)
+        for sf in status_files:
+            issue = _issue_number(sf)
+            if issue is not None and issue in rows:
+                _print_worker_row(issue, *rows[issue])
+                continue
+
+            data = next(unindexed_data)
+            if data is None:
+                typer.echo(f"  {sf.name}: {typer.style('error reading', fg='red')}")
+                continue
+
+            try:
+                _print_worker_row(
+                    data.get("issue_number", "?"),
+                    data.get("phase", "unknown"),
+                    data.get("pr_number"),
+                )
+            except Exception:
+                typer.echo(f"  {sf.name}: {typer.style('error reading', fg='red')}")
+
+
+def _print_worker_row(issue: object, phase: str, pr: int | None) -> None:
+    """Print one worker's line of list-workers output."""
+    phase_str = typer.style(phase, fg=_PHASE_COLORS.get(phase, "blue"))
+    pr_str = f" PR#{pr}" if pr else ""
+    typer.echo(f"  Issue #{issue}: {phase_str}{pr_str}")
+
+
+def _read_status_index(path: Path) -> dict[int, tuple[str, int | None]] | None:
+    """Read {issue_number: (phase, pr_number)} from the status index, or None if unreadable."""
+    try:
+        db = sqlite3.connect(f"{path.absolute().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None  # No index yet
+    try:
+        rows = db.execute("SELECT issue_number, phase, pr_number FROM workers").fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        db.close()
+    return {issue: (phase, pr) for issue, phase, pr in rows}
+
+
+def _issue_number(status_file: Path) -> int | None:
+    """Issue number from a worker-{issue_number}.json file name, or None if it has none."""
+    try:
+        return int(status_file.name.removeprefix("worker-").removesuffix(".json"))
+    except ValueError:
+        return None
 
-    if not status_files:
-        console.print("[yellow]No worker status files found[/yellow]")
-        raise typer.Exit(0)
 
-    console.print("[bold]Worker Agents:[/bold]")
-
-    for sf in sorted(status_files):
-        try:
-            data = json.loads(sf.read_text())
-            phase = data.get("phase", "unknown")
-            issue = data.get("issue_number", "?")
-            pr = data.get("pr_number")
-
-            phase_style = {
-                "completed": "green",
-                "failed": "red",
-                "blocked": "yellow",
-            }.get(phase, "blue")
-
-            pr_str = f" PR#{pr}" if pr else ""
-            console.print(f"  Issue #{issue}: [{phase_style}]{phase}[/{phase_style}]{pr_str}")
-        except Exception:
-            console.print(f"  {sf.name}: [red]error reading[/red]")
+def _find_status_files(status_dir: Path, prefix: str) -> list[Path]:
+    """Status files in status_dir named {prefix}*.json, sorted by name.
+
+    Uses os.scandir, which returns names straight from the directory listing
+    without glob's per-entry pattern matching and Path construction.
+    """
+    with os.scandir(status_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".json")
+        )
+    return [status_dir / name for name in names]
+
+
+def _read_status_file(path: Path) -> dict[str, Any] | None:
+    """Read and parse a status file, returning None if it can't be read."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _read_log_tail(path: Path, count: int) -> list[dict[str, Any]]:
+    """Parse the last `count` entries of a JSON Lines log file without reading all of it."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Walk back from the end one line at a time; only those lines are copied
+            lines: list[bytes] = []
+            end = len(mm)
+            while end > 0 and len(lines) < count:
+                start = mm.rfind(b"\n", 0, end - 1) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start
+
+    return [orjson.loads(line) for line in reversed(lines)]
 
 
 if __name__ == "__main__":
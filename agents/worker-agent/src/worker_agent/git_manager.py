@@ -3,13 +3,31 @@ Git manager for worker agent.
 Handles git operations including worktrees for parallel agent isolation.
 """
 
+import asyncio
+import os
 import shutil
 import subprocess
+import weakref
 from pathlib import Path
 
 from .models import LogLevel
 from .status_manager import StatusManager
 
+# Bounds git/installer processes across every worker running on the same event loop.
+# A semaphore is bound to the loop it's first used on, so each loop gets its own.
+_PROCESS_SLOTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _process_slots() -> asyncio.Semaphore:
+    """The running event loop's process semaphore, created on first use."""
+    loop = asyncio.get_running_loop()
+    slots = _PROCESS_SLOTS.get(loop)
+    if slots is None:
+        slots = _PROCESS_SLOTS[loop] = asyncio.Semaphore(os.cpu_count() or 4)
+    return slots
+
 
 class GitManager:
     """
@@ -23,8 +41,11 @@ class GitManager:
         worktree_base_dir: Path,
         issue_number: int,
         status_manager: StatusManager,
+        sparse_paths: list[str] | None = None,
     ) -> None:
         self.base_dir = base_dir
+        # Directories to check out (cone-mode sparse checkout); None for the full tree
+        self.sparse_paths = sparse_paths
         self.branch = f"worker/issue-{issue_number}"
         self.worktree_path = worktree_base_dir / f"issue-{issue_number}"
         self.status_manager = status_manager
@@ -45,61 +66,120 @@ class GitManager:
         self.worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Fetch latest from origin
-        self._exec("git fetch origin", self.base_dir)
+        await self._exec("git", "fetch", "origin", cwd=self.base_dir)
 
-        # Check if branch exists remotely
-        remote_branches = self._exec("git branch -r", self.base_dir)
-        branch_exists = f"origin/{self.branch}" in remote_branches
+        # Check if branch exists remotely (an exact ref lookup, rather than listing
+        # every remote branch and matching worker/issue-1 inside worker/issue-12)
+        try:
+            await self._exec(
+                "git",
+                "rev-parse",
+                "--verify",
+                "--quiet",
+                f"refs/remotes/origin/{self.branch}",
+                cwd=self.base_dir,
+            )
+            branch_exists = True
+        except subprocess.CalledProcessError:
+            branch_exists = False
+
+        # With sparse paths, files are checked out only after the sparse patterns are
+        # set, so the rest of the tree is never written to disk
+        no_checkout = ["--no-checkout"] if self.sparse_paths else []
 
         if branch_exists:
             # Checkout existing branch
-            self._exec(
-                f'git worktree add "{self.worktree_path}" {self.branch}',
-                self.base_dir,
+            await self._exec(
+                "git",
+                "worktree",
+                "add",
+                *no_checkout,
+                str(self.worktree_path),
+                self.branch,
+                cwd=self.base_dir,
             )
             self.status_manager.log(LogLevel.INFO, f"Resumed existing branch: {self.branch}")
         else:
             # Create new branch from main
-            self._exec(
-                f'git worktree add -b {self.branch} "{self.worktree_path}" origin/main',
-                self.base_dir,
+            await self._exec(
+                "git",
+                "worktree",
+                "add",
+                *no_checkout,
+                "-b",
+                self.branch,
+                str(self.worktree_path),
+                "origin/main",
+                cwd=self.base_dir,
             )
             self.status_manager.log(LogLevel.INFO, f"Created new branch: {self.branch}")
 
-        # Install dependencies in worktree if package.json exists
-        package_json = self.worktree_path / "package.json"
-        if package_json.exists():
-            self.status_manager.log(LogLevel.INFO, "Installing dependencies in worktree...")
-            self._exec("npm install", self.worktree_path)
-
-        # Or pyproject.toml for Python projects
-        pyproject = self.worktree_path / "pyproject.toml"
-        if pyproject.exists():
-            self.status_manager.log(LogLevel.INFO, "Installing Python dependencies in worktree...")
-            # Try uv first, fall back to pip
-            try:
-                self._exec("uv sync", self.worktree_path)
-            except subprocess.CalledProcessError:
-                self._exec("pip install -e .", self.worktree_path)
+        if self.sparse_paths:
+            await self._exec(
+                "git",
+                "sparse-checkout",
+                "set",
+                "--cone",
+                "--",
+                *self.sparse_paths,
+                cwd=self.worktree_path,
+            )
+            await self._exec("git", "checkout", cwd=self.worktree_path)
+            self.status_manager.log(
+                LogLevel.INFO, f"Sparse checkout of: {', '.join(self.sparse_paths)}"
+            )
+
+        # Install dependencies for each project type in the worktree. npm and the
+        # Python installer work on separate files, so a repo with both runs them together
+        installs = []
+        if (self.worktree_path / "package.json").exists():
+            installs.append(self._install_node_dependencies())
+        if (self.worktree_path / "pyproject.toml").exists():
+            installs.append(self._install_python_dependencies())
+        await asyncio.gather(*installs)
+
+    async def _install_node_dependencies(self) -> None:
+        """Install npm dependencies in the worktree."""
+        self.status_manager.log(LogLevel.INFO, "Installing dependencies in worktree...")
+        # Prefer npm's local cache to the registry; skip the audit and funding lookups
+        await self._exec(
+            "npm", "install", "--prefer-offline", "--no-audit", "--no-fund", cwd=self.worktree_path
+        )
+
+    async def _install_python_dependencies(self) -> None:
+        """Install Python dependencies in the worktree with uv.
+
+        There's deliberately no pip fallback: it hid uv failures behind a much slower
+        install, so a missing uv or a failed sync now fails worktree setup instead.
+        """
+        self.status_manager.log(LogLevel.INFO, "Installing Python dependencies in worktree...")
+        # With a lockfile, --frozen installs exactly what it pins without re-resolving
+        frozen = ["--frozen"] if (self.worktree_path / "uv.lock").exists() else []
+        try:
+            await self._exec("uv", "sync", *frozen, cwd=self.worktree_path)
+        except FileNotFoundError:
+            self.status_manager.log(
+                LogLevel.ERROR, "uv is required to install Python dependencies but was not found"
+            )
+            raise
 
     async def commit(self, message: str) -> str | None:
         """Commit changes with message. Returns SHA or None if no changes."""
         try:
             # Check if there are changes to commit
-            status = self._exec("git status --porcelain", self.worktree_path)
+            status = await self._exec("git", "status", "--porcelain", cwd=self.worktree_path)
             if not status.strip():
                 self.status_manager.log(LogLevel.DEBUG, "No changes to commit")
                 return None
 
             # Stage all changes
-            self._exec("git add -A", self.worktree_path)
+            await self._exec("git", "add", "-A", cwd=self.worktree_path)
 
-            # Commit
-            escaped_message = message.replace('"', '\\"')
-            self._exec(f'git commit -m "{escaped_message}"', self.worktree_path)
+            # Commit (the message is passed as-is; there's no shell to quote for)
+            await self._exec("git", "commit", "-m", message, cwd=self.worktree_path)
 
             # Get commit SHA
-            sha = self._exec("git rev-parse HEAD", self.worktree_path).strip()
+            sha = (await self._exec("git", "rev-parse", "HEAD", cwd=self.worktree_path)).strip()
 
             await self.status_manager.add_commit(sha)
             return sha
@@ -110,7 +190,7 @@ class GitManager:
     async def push(self) -> bool:
         """Push to remote."""
         try:
-            self._exec(f"git push -u origin {self.branch}", self.worktree_path)
+            await self._exec("git", "push", "-u", "origin", self.branch, cwd=self.worktree_path)
             self.status_manager.log(LogLevel.INFO, f"Pushed to origin/{self.branch}")
             return True
         except subprocess.CalledProcessError as e:
@@ -118,26 +198,27 @@ class GitManager:
             return False
 
     async def has_conflicts(self) -> bool:
-        """Check for merge conflicts with main."""
+        """Check for merge conflicts with main (needs git 2.38+ for merge-tree --write-tree)."""
         try:
-            self._exec("git fetch origin main", self.worktree_path)
+            await self._exec("git", "fetch", "origin", "main", cwd=self.worktree_path)
 
-            # Try merge --no-commit to check for conflicts
+            # Merge in memory: exit status 1 means conflicts, and the worktree and
+            # index are never touched, so there's no merge to abort afterwards
             try:
-                self._exec(
-                    "git merge origin/main --no-commit --no-ff",
-                    self.worktree_path,
+                await self._exec(
+                    "git",
+                    "merge-tree",
+                    "--write-tree",
+                    "--no-messages",
+                    "HEAD",
+                    "origin/main",
+                    cwd=self.worktree_path,
                 )
-                # No conflicts - abort the merge
-                self._exec("git merge --abort", self.worktree_path)
                 return False
-            except subprocess.CalledProcessError:
-                # Conflicts detected - abort the merge
-                try:
-                    self._exec("git merge --abort", self.worktree_path)
-                except subprocess.CalledProcessError:
-                    pass  # May already be aborted
-                return True
+            except subprocess.CalledProcessError as e:
+                if e.returncode == 1:
+                    return True
+                raise
         except subprocess.CalledProcessError as e:
             self.status_manager.log(LogLevel.ERROR, f"Failed to check conflicts: {e}")
             return True  # Assume conflicts on error
@@ -145,14 +226,14 @@ class GitManager:
     async def rebase_on_main(self) -> bool:
         """Rebase on main to resolve simple conflicts."""
         try:
-            self._exec("git fetch origin main", self.worktree_path)
-            self._exec("git rebase origin/main", self.worktree_path)
+            await self._exec("git", "fetch", "origin", "main", cwd=self.worktree_path)
+            await self._exec("git", "rebase", "origin/main", cwd=self.worktree_path)
             self.status_manager.log(LogLevel.INFO, "Successfully rebased on main")
             return True
         except subprocess.CalledProcessError as e:
             # Abort failed rebase
             try:
-                self._exec("git rebase --abort", self.worktree_path)
+                await self._exec("git", "rebase", "--abort", cwd=self.worktree_path)
             except subprocess.CalledProcessError:
                 pass  # May not be in rebase state
             self.status_manager.log(
@@ -161,21 +242,24 @@ class GitManager:
             )
             return False
 
-    def get_changed_files(self) -> list[str]:
+    async def get_changed_files(self) -> list[str]:
         """Get list of changed files compared to main."""
-        diff = self._exec("git diff --name-only origin/main", self.worktree_path)
-        return [f.strip() for f in diff.split("\n") if f.strip()]
+        # -z gives raw NUL-terminated paths: no C-style quoting of unusual characters,
+        # and names containing newlines or spaces come through intact
+        diff = await self._exec(
+            "git", "diff", "-z", "--name-only", "origin/main", cwd=self.worktree_path
+        )
+        return [name for name in diff.split("\0") if name]
 
-    def get_log(self, count: int = 10) -> str:
+    async def get_log(self, count: int = 10) -> str:
         """Get git log for this branch."""
-        return self._exec(f"git log --oneline -{count}", self.worktree_path)
+        return await self._exec("git", "log", "--oneline", f"-{count}", cwd=self.worktree_path)
 
     async def cleanup(self) -> None:
         """Cleanup worktree."""
         try:
-            self._exec(
-                f'git worktree remove "{self.worktree_path}" --force',
-                self.base_dir,
+            await self._exec(
+                "git", "worktree", "remove", str(self.worktree_path), "--force", cwd=self.base_dir
             )
             self.status_manager.log(LogLevel.INFO, "Cleaned up worktree")
         except subprocess.CalledProcessError as e:
@@ -186,15 +270,23 @@ class GitManager:
             except Exception:
                 pass
 
-    def _exec(self, command: str, cwd: Path) -> str:
-        """Execute git command synchronously."""
-        self.status_manager.log(LogLevel.DEBUG, f"Executing: {command}")
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
+    async def _exec(self, *args: str, cwd: Path) -> str:
+        """Run a command without a shell or blocking the event loop.
+
+        Raises subprocess.CalledProcessError on a non-zero exit, like subprocess.run(check=True).
+        """
+        self.status_manager.log(LogLevel.DEBUG, f"Executing: {' '.join(args)}")
+        async with _process_slots():
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+        output = stdout.decode("utf-8", errors="replace")
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode, args, output, stderr.decode("utf-8", errors="replace")
+            )
+        return output
@@ -5,10 +5,19 @@ Handles PRs, reviews, issues, and CI checks.
 
 import asyncio
 import re
+import time
+from collections import defaultdict
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from github import Github
+from github.CheckRun import CheckRun
+from github.Commit import Commit
+from github.CommitCombinedStatus import CommitCombinedStatus
+from github.CommitStatus import CommitStatus
 from github.GithubException import GithubException
+from worker_shared import ttl_cache
+from worker_shared.github_ops import sleep_until_next_poll
 
 from .models import (
     CIStatus,
@@ -20,6 +29,51 @@ from .models import (
 )
 from .status_manager import StatusManager
 
+if TYPE_CHECKING:
+    from github.Issue import Issue
+
+# Review comment keywords that make the comment blocking
+BLOCKING_KEYWORDS_RE = re.compile(r"must|required|blocking|security", re.IGNORECASE)
+
+# Phrases in a Claude comment that mean it is asking for changes
+CHANGE_REQUEST_RE = re.compile(
+    r"fix:|issue:|bug:|error:|problem:|should|must|need to",
+    re.IGNORECASE,
+)
+
+# File references in Claude comments: [file.py:123](url)
+FILE_REF_RE = re.compile(r"\[`?([^`\]]+(?::\d+)?)`?\]")
+
+# Items per page when listing reviews, comments and check runs; GitHub's maximum,
+# so most lists arrive in one request over the client's keep-alive connection
+GITHUB_PAGE_SIZE = 100
+
+# Default seconds between polls while waiting on a review, PR CI and the main build.
+# The wait_for_* methods take poll_seconds to override them (e.g. for test runs)
+REVIEW_POLL_SECONDS = 15
+CI_POLL_SECONDS = 30
+MAIN_BUILD_POLL_SECONDS = 15
+
+# Issue details are reused for this long, so the several lookups during one
+# run cost a single request while edits to the issue are still picked up
+ISSUE_CACHE_SECONDS = 600
+
+# Worker review status for each GitHub review state
+REVIEW_STATUS_BY_STATE = {
+    "APPROVED": ReviewStatus.APPROVED,
+    "CHANGES_REQUESTED": ReviewStatus.CHANGES_REQUESTED,
+    "COMMENTED": ReviewStatus.COMMENTED,
+}
+
+# Login substrings identifying Claude GitHub integration
+CLAUDE_LOGIN_MARKERS = ("claude", "anthropic")
+
+
+def _is_claude_user(login: str, user_type: str) -> bool:
+    """Whether a GitHub user is Claude GitHub integration (or another bot)."""
+    login_lower = login.lower()
+    return user_type == "Bot" or any(marker in login_lower for marker in CLAUDE_LOGIN_MARKERS)
+
 
 class GitHubManager:
     """
@@ -29,11 +83,23 @@ class GitHubManager:
     def __init__(self, config: WorkerConfig, status_manager: StatusManager) -> None:
         self.config = config
         self.status_manager = status_manager
-        self.github = Github(config.github_token)
+        self.github = Github(config.github_token, per_page=GITHUB_PAGE_SIZE)
         self.repo = self.github.get_repo(f"{config.repo_owner}/{config.repo_name}")
 
+        # Issue objects for PRs, fetched once and reused by every comment poll
+        self._pr_issues: dict[int, Issue] = {}
+
+    def close(self) -> None:
+        """Close the GitHub client's pooled connections."""
+        self.github.close()
+
+    @ttl_cache(ISSUE_CACHE_SECONDS)
     async def get_issue(self, issue_number: int) -> dict[str, str | list[str]]:
-        """Get issue details."""
+        """Get issue details, reusing them for up to ISSUE_CACHE_SECONDS."""
+        return await asyncio.to_thread(self._fetch_issue, issue_number)
+
+    def _fetch_issue(self, issue_number: int) -> dict[str, str | list[str]]:
+        """Fetch issue details (blocking)."""
         issue = self.repo.get_issue(issue_number)
         return {
             "title": issue.title,
@@ -100,31 +166,35 @@ class GitHubManager:
 
     async def get_pr_reviews(self, pr_number: int) -> list[PRReview]:
         """Get PR reviews, filtering for Claude GitHub integration."""
+        # PyGithub blocks and paginates, so keep it off the event loop
+        return await asyncio.to_thread(self._fetch_pr_reviews, pr_number)
+
+    def _fetch_pr_reviews(self, pr_number: int) -> list[PRReview]:
+        """Fetch PR reviews with their comments (blocking)."""
         pr = self.repo.get_pull(pr_number)
         reviews = list(pr.get_reviews())
-        review_comments = list(pr.get_review_comments())
+        if not reviews:
+            return []  # Review comments always belong to a review, so skip listing them
+
+        # Index comments by review in one pass instead of scanning them all per review
+        comments_by_review: dict[int, list[ReviewComment]] = defaultdict(list)
+        for comment in pr.get_review_comments():
+            # Consider comment blocking if it contains certain keywords
+            is_blocking = BLOCKING_KEYWORDS_RE.search(comment.body) is not None
+            comments_by_review[comment.pull_request_review_id].append(
+                ReviewComment(
+                    path=comment.path,
+                    line=comment.line or comment.original_line or 0,
+                    body=comment.body,
+                    is_blocking=is_blocking,
+                )
+            )
 
         result: list[PRReview] = []
 
         for review in reviews:
             # Get comments for this review
-            comments_for_review: list[ReviewComment] = []
-            for comment in review_comments:
-                if comment.pull_request_review_id == review.id:
-                    # Consider comment blocking if it contains certain keywords
-                    body_lower = comment.body.lower()
-                    is_blocking = any(
-                        keyword in body_lower
-                        for keyword in ["must", "required", "blocking", "security"]
-                    )
-                    comments_for_review.append(
-                        ReviewComment(
-                            path=comment.path,
-                            line=comment.line or comment.original_line or 0,
-                            body=comment.body,
-                            is_blocking=is_blocking,
-                        )
-                    )
+            comments_for_review = comments_by_review.get(review.id, [])
 
             submitted_at = None
             if review.submitted_at:
@@ -150,8 +220,25 @@ class GitHubManager:
         Claude GitHub integration posts issue comments (not formal reviews),
         so we need to check these separately.
         """
-        pr = self.repo.get_pull(pr_number)
-        issue_comments = list(pr.get_issue_comments())
+        comments, _ = await asyncio.to_thread(self._fetch_pr_comments_from_claude, pr_number)
+        return comments
+
+    def _fetch_pr_comments_from_claude(
+        self, pr_number: int, since: datetime | None = None
+    ) -> tuple[list[PRReview], datetime | None]:
+        """
+        Fetch Claude's PR issue comments (blocking).
+
+        If since is given, only comments updated at or after it are fetched.
+        Also returns the latest updated_at among all fetched comments (Claude's
+        or not), to pass as since on the next poll.
+        """
+        # PR conversation comments are issue comments on the PR's issue number
+        issue = self._pr_issues.get(pr_number)
+        if issue is None:
+            issue = self._pr_issues[pr_number] = self.repo.get_issue(pr_number)
+        issue_comments = list(issue.get_comments(since=since) if since else issue.get_comments())
+        latest_update = max((c.updated_at for c in issue_comments), default=since)
 
         result: list[PRReview] = []
 
@@ -160,23 +247,13 @@ class GitHubManager:
             user_type = comment.user.type if comment.user else "User"
 
             # Check if this is from Claude
-            is_claude = (
-                user_type == "Bot"
-                or "claude" in user_login.lower()
-                or "anthropic" in user_login.lower()
-            )
+            is_claude = _is_claude_user(user_login, user_type)
 
             if not is_claude:
                 continue
 
-            # Parse comment to determine if it's requesting changes
-            body_lower = comment.body.lower()
-
             # Claude comments that suggest fixes are treated as change requests
-            requests_changes = any(
-                indicator in body_lower
-                for indicator in ["fix:", "issue:", "bug:", "error:", "problem:", "should", "must", "need to"]
-            )
+            requests_changes = CHANGE_REQUEST_RE.search(comment.body) is not None
 
             # Determine state based on content
             if requests_changes:
@@ -187,7 +264,7 @@ class GitHubManager:
             # Extract file path and line from comment if present
             # Claude format: [file.py:123](url)
             review_comments: list[ReviewComment] = []
-            file_refs = re.findall(r'\[`?([^`\]]+(?::\d+)?)`?\]', comment.body)
+            file_refs = FILE_REF_RE.findall(comment.body)
             for ref in file_refs:
                 if ':' in ref:
                     path, line_str = ref.rsplit(':', 1)
@@ -222,13 +299,14 @@ class GitHubManager:
                 )
             )
 
-        return result
+        return result, latest_update
 
     async def wait_for_claude_review(
         self,
         pr_number: int,
         timeout_seconds: int,
         already_processed_ids: set[int] | None = None,
+        poll_seconds: float = REVIEW_POLL_SECONDS,
     ) -> PRReview | None:
         """Wait for Claude GitHub integration to review.
 
@@ -241,10 +319,12 @@ class GitHubManager:
             timeout_seconds: How long to wait
             already_processed_ids: Set of comment IDs that have already been
                 addressed - these will be skipped to avoid re-processing
+            poll_seconds: Delay between checks
         """
-        start_time = datetime.now()
-        poll_interval = 15  # seconds
+        deadline = time.monotonic() + timeout_seconds
         skip_ids = already_processed_ids or set()
+        # After the first poll only comments updated since the latest one seen are fetched
+        comments_since: datetime | None = None
 
         self.status_manager.log(
             LogLevel.INFO,
@@ -256,34 +336,29 @@ class GitHubManager:
                 f"Skipping {len(skip_ids)} already-processed comment(s)",
             )
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
+        while time.monotonic() < deadline:
+            # Fetch formal reviews and issue comments concurrently
+            reviews, (claude_comments, comments_since) = await asyncio.gather(
+                self.get_pr_reviews(pr_number),
+                asyncio.to_thread(self._fetch_pr_comments_from_claude, pr_number, comments_since),
+            )
+
             # Check formal PR reviews first
-            reviews = await self.get_pr_reviews(pr_number)
             for review in reviews:
                 if review.id in skip_ids:
                     continue
-                is_claude = (
-                    review.user_type == "Bot"
-                    or "claude" in review.user_login.lower()
-                    or "anthropic" in review.user_login.lower()
-                )
+                is_claude = _is_claude_user(review.user_login, review.user_type)
                 if is_claude and review.state != "PENDING":
                     self.status_manager.log(
                         LogLevel.INFO,
                         f"Claude formal review received: {review.state}",
                     )
-                    status_map = {
-                        "APPROVED": ReviewStatus.APPROVED,
-                        "CHANGES_REQUESTED": ReviewStatus.CHANGES_REQUESTED,
-                        "COMMENTED": ReviewStatus.COMMENTED,
-                    }
                     await self.status_manager.set_review_status(
-                        status_map.get(review.state, ReviewStatus.COMMENTED)
+                        REVIEW_STATUS_BY_STATE.get(review.state, ReviewStatus.COMMENTED)
                     )
                     return review
 
             # Check issue comments (Claude GitHub integration uses these)
-            claude_comments = await self.get_pr_comments_from_claude(pr_number)
             for comment in claude_comments:
                 if comment.id in skip_ids:
                     continue
@@ -291,21 +366,16 @@ class GitHubManager:
                     LogLevel.INFO,
                     f"Claude comment received: {comment.state} from {comment.user_login}",
                 )
-                status_map = {
-                    "APPROVED": ReviewStatus.APPROVED,
-                    "CHANGES_REQUESTED": ReviewStatus.CHANGES_REQUESTED,
-                    "COMMENTED": ReviewStatus.COMMENTED,
-                }
                 await self.status_manager.set_review_status(
-                    status_map.get(comment.state, ReviewStatus.COMMENTED)
+                    REVIEW_STATUS_BY_STATE.get(comment.state, ReviewStatus.COMMENTED)
                 )
                 return comment
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"No new Claude feedback yet, polling in {poll_interval}s...",
+                f"No new Claude feedback yet, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -313,19 +383,20 @@ class GitHubManager:
         )
         return None
 
-    async def get_pr_check_status(self, pr_number: int) -> CIStatus:
-        """Get PR check status (CI)."""
-        pr = self.repo.get_pull(pr_number)
-        head_sha = pr.head.sha
-
-        # Get combined status
-        combined_status = self.repo.get_commit(head_sha).get_combined_status()
+    async def get_pr_check_status(
+        self, pr_number: int, head_commit: Commit | None = None
+    ) -> CIStatus:
+        """Get PR check status (CI).
 
-        # Get check runs (GitHub Actions)
-        check_runs = list(self.repo.get_commit(head_sha).get_check_runs())
+        Pass the PR's head commit when checking it repeatedly, to skip looking it up again.
+        """
+        if head_commit is None:
+            head_commit = await asyncio.to_thread(self._fetch_pr_head_commit, pr_number)
+        combined_status, statuses, check_runs = await asyncio.to_thread(
+            self._fetch_commit_checks, head_commit
+        )
 
         # Check if there are no CI checks configured
-        statuses = list(combined_status.statuses)
         if not check_runs and not statuses:
             # No CI configured - treat as success
             self.status_manager.log(
@@ -354,15 +425,37 @@ class GitHubManager:
         await self.status_manager.set_ci_status(CIStatus.PENDING)
         return CIStatus.PENDING
 
-    async def wait_for_ci(self, pr_number: int, timeout_seconds: int) -> CIStatus:
+    def _fetch_pr_head_commit(self, pr_number: int) -> Commit:
+        """Fetch the head commit of a PR (blocking)."""
+        pr = self.repo.get_pull(pr_number)
+        return self.repo.get_commit(pr.head.sha)
+
+    def _fetch_commit_checks(
+        self, commit: Commit
+    ) -> tuple[CommitCombinedStatus, list[CommitStatus], list[CheckRun]]:
+        """Fetch the combined status, statuses and check runs of a commit (blocking)."""
+        # Get combined status
+        combined_status = commit.get_combined_status()
+
+        # Get check runs (GitHub Actions)
+        check_runs = list(commit.get_check_runs())
+
+        return combined_status, list(combined_status.statuses), check_runs
+
+    async def wait_for_ci(
+        self, pr_number: int, timeout_seconds: int, poll_seconds: float = CI_POLL_SECONDS
+    ) -> CIStatus:
         """Wait for CI checks to complete."""
-        start_time = datetime.now()
-        poll_interval = 30  # seconds
+        deadline = time.monotonic() + timeout_seconds
 
         self.status_manager.log(LogLevel.INFO, f"Waiting for CI checks on PR #{pr_number}")
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
-            status = await self.get_pr_check_status(pr_number)
+        # Nothing is pushed while waiting, so the head is looked up once and each
+        # poll only fetches its check state
+        head_commit = await asyncio.to_thread(self._fetch_pr_head_commit, pr_number)
+
+        while time.monotonic() < deadline:
+            status = await self.get_pr_check_status(pr_number, head_commit)
 
             if status == CIStatus.SUCCESS:
                 self.status_manager.log(LogLevel.INFO, "CI checks passed")
@@ -374,9 +467,9 @@ class GitHubManager:
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"CI still pending, polling in {poll_interval}s...",
+                f"CI still pending, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -384,20 +477,26 @@ class GitHubManager:
         )
         return CIStatus.FAILURE
 
-    async def wait_for_main_branch_build(self, timeout_seconds: int) -> CIStatus:
+    async def wait_for_main_branch_build(
+        self, timeout_seconds: int, poll_seconds: float = MAIN_BUILD_POLL_SECONDS
+    ) -> CIStatus:
         """Wait for main branch build to complete after merge."""
-        start_time = datetime.now()
-        poll_interval = 15  # seconds
+        deadline = time.monotonic() + timeout_seconds
 
         self.status_manager.log(LogLevel.INFO, "Waiting for main branch build...")
 
         # Get the latest commit on main
-        main_branch = self.repo.get_branch("main")
+        main_branch = await asyncio.to_thread(self.repo.get_branch, "main")
+
+        def fetch_main_checks() -> tuple[list[CheckRun], CommitCombinedStatus]:
+            return (
+                list(main_branch.commit.get_check_runs()),
+                main_branch.commit.get_combined_status(),
+            )
 
-        while (datetime.now() - start_time).total_seconds() < timeout_seconds:
+        while time.monotonic() < deadline:
             # Get check runs for main
-            check_runs = list(main_branch.commit.get_check_runs())
-            combined_status = main_branch.commit.get_combined_status()
+            check_runs, combined_status = await asyncio.to_thread(fetch_main_checks)
 
             has_failure = combined_status.state == "failure" or any(
                 run.conclusion == "failure" for run in check_runs
@@ -417,9 +516,9 @@ class GitHubManager:
 
             self.status_manager.log(
                 LogLevel.DEBUG,
-                f"Main build still pending, polling in {poll_interval}s...",
+                f"Main build still pending, polling in {poll_seconds:g}s...",
             )
-            await asyncio.sleep(poll_interval)
+            await sleep_until_next_poll(poll_seconds, deadline)
 
         self.status_manager.log(
             LogLevel.WARN,
@@ -434,7 +533,8 @@ class GitHubManager:
         comment: ReviewComment,
     ) -> int:
         """Create an issue for non-blocking review feedback."""
-        issue = self.repo.create_issue(
+        issue = await asyncio.to_thread(
+            self.repo.create_issue,
             title=f"Follow-up from PR #{pr_number}: {comment.path}",
             body=f"""## Non-blocking feedback from code review
 
@@ -450,7 +550,6 @@ _Created automatically by worker agent from non-blocking review comment_""",
             labels=["follow-up", "from-review"],
         )
 
-        await self.status_manager.add_created_issue(issue.number)
         return issue.number
 
     async def merge_pr(self, pr_number: int) -> bool:
@@ -12,6 +12,10 @@ from pydantic import BaseModel, Field
 
 # Import shared models
 from worker_shared import (
+    COMMITS_FILE_NAME,
+    LOGS_FILE_NAME,
+    MAX_STATUS_LOGS,
+    STATUS_FILE_NAME,
     CIStatus,
     LogEntry,
     LogLevel,
@@ -20,11 +24,13 @@ from worker_shared import (
     PRReview,
     ReviewComment,
     ReviewStatus,
+    StatusLogs,
 )
 
 # Re-export shared models for backwards compatibility
 __all__ = [
     # Shared models (re-exported)
+    "MAX_STATUS_LOGS",
     "CIStatus",
     "LogEntry",
     "LogLevel",
@@ -39,8 +45,17 @@ __all__ = [
     "WorkerConfig",
     "ValidationStep",
     "ValidationResult",
+    # Status file layout
+    "STATUS_FILE_NAME",
+    "LOGS_FILE_NAME",
+    "COMMITS_FILE_NAME",
+    "STATUS_DB_NAME",
 ]
 
+# SQLite index with one row per worker in the status dir, so listing workers needn't
+# parse every status file
+STATUS_DB_NAME = "status.db"
+
 
 class WorkerPhase(str, Enum):
     """Current phase of the worker agent lifecycle."""
@@ -80,7 +95,7 @@ class WorkerStatus(BaseModel):
     ci_status: CIStatus | None = None
     blocked_reason: str | None = None
     created_issues: list[int] = Field(default_factory=list)
-    logs: list[LogEntry] = Field(default_factory=list)
+    logs: StatusLogs[LogEntry]
     main_branch_verified: bool = False
 
 
@@ -95,6 +110,8 @@ class WorkerConfig(BaseModel):
     # Working directory configuration
     base_dir: Path
     worktree_base_dir: Path
+    # Directories to check out in the worktree (sparse checkout); None for everything
+    sparse_paths: list[str] | None = None
 
     # Status file location
     status_dir: Path
@@ -110,6 +127,9 @@ class WorkerConfig(BaseModel):
     # Validation thresholds
     coverage_threshold: int = 70
 
+    # Log entries below this level are dropped before any work is done
+    min_log_level: LogLevel = LogLevel.INFO
+
     # Communication channel for manager
     manager_notification_file: Path | None = None
 
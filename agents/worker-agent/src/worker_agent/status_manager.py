@@ -3,14 +3,27 @@ Status manager for worker agent.
 Handles logging, status persistence, and manager notifications.
 """
 
-import json
+import asyncio
+import contextlib
 import os
+import sqlite3
+import time
+from collections import deque
+from collections.abc import AsyncIterator
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
 from rich.console import Console
+from worker_shared import append_bytes, write_atomic
 
 from .models import (
+    COMMITS_FILE_NAME,
+    LOGS_FILE_NAME,
+    MAX_STATUS_LOGS,
+    STATUS_DB_NAME,
+    STATUS_FILE_NAME,
     CIStatus,
     LogEntry,
     LogLevel,
@@ -24,6 +37,92 @@ from .models import (
 
 console = Console()
 
+# Console style and icon for each log level
+_LOG_STYLES = {
+    LogLevel.DEBUG: "dim",
+    LogLevel.INFO: "blue",
+    LogLevel.WARN: "yellow",
+    LogLevel.ERROR: "red bold",
+}
+_LOG_ICONS = {
+    LogLevel.DEBUG: "🔍",
+    LogLevel.INFO: "📋",
+    LogLevel.WARN: "⚠️",
+    LogLevel.ERROR: "❌",
+}
+# Severity order used to filter against config.min_log_level
+_LOG_LEVEL_RANK = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARN: 2,
+    LogLevel.ERROR: 3,
+}
+
+# updated_at only needs coarse precision, so the clock is read at most this often
+TIMESTAMP_REFRESH_SECONDS = 0.5
+
+# Status changes made within this window after the first one are written together
+WRITE_COALESCE_SECONDS = 0.25
+
+# After a failed write, retries back off from WRITE_COALESCE_SECONDS up to this
+WRITE_RETRY_MAX_SECONDS = 30.0
+
+# Fields of the status kept out of the status file
+_APPENDED_FIELDS = {"logs", "commits"}
+
+# Status index table; each flush replaces the worker's row with its latest status
+_STATUS_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workers (
+    issue_number INTEGER PRIMARY KEY,
+    phase TEXT NOT NULL,
+    pr_number INTEGER,
+    updated_at TEXT NOT NULL,
+    json BLOB NOT NULL
+)
+"""
+_UPSERT_WORKER = "INSERT OR REPLACE INTO workers VALUES (?, ?, ?, ?, ?)"
+_DELETE_WORKER = "DELETE FROM workers WHERE issue_number = ?"
+
+# Notification file is opened for appending only, so each write lands at the end
+_NOTIFICATION_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+# Serializers for records written on every persist or notification, built once
+_dump_status = TypeAdapter(WorkerStatus).dump_json
+_dump_log_entry = TypeAdapter(LogEntry).dump_json
+_dump_notification = TypeAdapter(ManagerNotification).dump_json
+
+
+def _append_notification(path: Path, line: bytes) -> None:
+    """Append a line in a single write, so lines from workers sharing the file don't interleave."""
+    fd = os.open(path, _NOTIFICATION_OPEN_FLAGS, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def _open_status_db(path: Path, status_file_name: str) -> sqlite3.Connection:
+    """Open the status index shared by workers in a status dir, creating it if needed.
+
+    Rows for workers whose status file has since been removed are dropped. The default
+    rollback journal is kept rather than WAL, which needs shared memory that network
+    filesystems don't provide.
+    """
+    # Only used from the writer thread, one call at a time under the write lock
+    db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+    with db:
+        db.execute(_STATUS_DB_SCHEMA)
+        issue_numbers = [row[0] for row in db.execute("SELECT issue_number FROM workers")]
+        db.executemany(
+            _DELETE_WORKER,
+            [
+                (issue_number,)
+                for issue_number in issue_numbers
+                if not path.with_name(status_file_name.format(issue_number=issue_number)).exists()
+            ],
+        )
+    return db
+
 
 class StatusManager:
     """
@@ -39,7 +138,31 @@ class StatusManager:
         worktree_path: str,
     ) -> None:
         self.config = config
-        self.status_file_path = config.status_dir / f"worker-{issue_number}.json"
+        self.status_file_path = config.status_dir / STATUS_FILE_NAME.format(
+            issue_number=issue_number
+        )
+        self.logs_file_path = config.status_dir / LOGS_FILE_NAME.format(issue_number=issue_number)
+        self.commits_file_path = config.status_dir / COMMITS_FILE_NAME.format(
+            issue_number=issue_number
+        )
+        self.status_db_path = config.status_dir / STATUS_DB_NAME
+        self._db: sqlite3.Connection | None = None
+
+        # Pending changes, written to disk by _write_loop
+        self._dirty = False
+        self._pending_logs: list[LogEntry] = []
+        self._pending_commits: list[str] = []
+        self._write_requested = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Set by close() to stop the background writer between writes
+        self._closing = asyncio.Event()
+
+        # Copy returned by get_status(), reused until the next change
+        self._snapshot: WorkerStatus | None = None
+
+        # Inside batch(), changes are held back until the outermost block exits
+        self._batch_depth = 0
 
         self.status = WorkerStatus(
             pid=os.getpid(),
@@ -48,108 +171,274 @@ class StatusManager:
             worktree_path=worktree_path,
         )
 
+        # Levels below config.min_log_level are dropped by log()
+        self._min_log_rank = _LOG_LEVEL_RANK[config.min_log_level]
+
+        # "[phase]" shown before each console log line
+        self._phase_tag = f"[{self.status.phase.value}]"
+
+        # Cached clock reading for updated_at, see _now()
+        self._now_cached = datetime.now()
+        self._now_refreshed_at = time.monotonic()
+
     async def initialize(self) -> None:
         """Initialize status file - creates directory if needed."""
         self.config.status_dir.mkdir(parents=True, exist_ok=True)
-        await self._persist()
+        # Start fresh logs/commits if a previous run for this issue left some behind
+        self.logs_file_path.write_bytes(b"")
+        self.commits_file_path.write_bytes(b"")
+        try:
+            self._db = await asyncio.to_thread(
+                _open_status_db, self.status_db_path, STATUS_FILE_NAME
+            )
+        except sqlite3.Error as e:
+            # Only list-workers uses the index; it falls back to reading status files
+            self.log(LogLevel.WARN, f"Status index unavailable: {e}")
+        self._request_write()
+        await self.flush()
         self.log(LogLevel.INFO, f"Worker agent started for issue #{self.status.issue_number}")
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def close(self) -> None:
+        """Stop the background writer and write any pending changes."""
+        if self._writer_task is not None:
+            # Stop the writer between writes rather than cancelling one mid-thread
+            self._closing.set()
+            self._write_requested.set()
+            await self._writer_task
+            self._writer_task = None
+        try:
+            await self.flush()
+        finally:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
     def log(self, level: LogLevel, message: str) -> None:
         """Add log entry."""
-        entry = LogEntry(level=level, message=message)
+        if _LOG_LEVEL_RANK[level] < self._min_log_rank:
+            return
+        # Built without validation; the same timestamp becomes updated_at
+        now = datetime.now()
+        entry = LogEntry.model_construct(timestamp=now, level=level, message=message)
         self.status.logs.append(entry)
-        self.status.updated_at = datetime.now()
-
-        # Output to console with rich formatting
-        style_map = {
-            LogLevel.DEBUG: "dim",
-            LogLevel.INFO: "blue",
-            LogLevel.WARN: "yellow",
-            LogLevel.ERROR: "red bold",
-        }
-        icon_map = {
-            LogLevel.DEBUG: "🔍",
-            LogLevel.INFO: "📋",
-            LogLevel.WARN: "⚠️",
-            LogLevel.ERROR: "❌",
-        }
+        self._pending_logs.append(entry)
+        self.status.updated_at = now
+        self._request_write()
 
+        # Plain text in the level's style, without rich markup or highlighting
         console.print(
-            f"{icon_map[level]} [{self.status.phase.value}] {message}",
-            style=style_map[level],
+            _LOG_ICONS[level],
+            self._phase_tag,
+            message,
+            style=_LOG_STYLES[level],
+            markup=False,
+            highlight=False,
         )
 
-        # Persist asynchronously (fire and forget for non-critical updates)
-        # In practice, we'll call _persist explicitly at key points
+    def is_logged(self, level: LogLevel) -> bool:
+        """Whether log() keeps entries at this level (to skip building dropped messages)."""
+        return _LOG_LEVEL_RANK[level] >= self._min_log_rank
 
     async def set_phase(self, phase: WorkerPhase) -> None:
         """Update phase."""
         self.status.phase = phase
-        self.status.updated_at = datetime.now()
+        self._phase_tag = f"[{self.status.phase.value}]"
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Phase changed to: {phase.value}")
-        await self._persist()
+        self._request_write()
+        # Also sent to the manager as a status_update notification
+        await self.notify_manager(
+            NotificationType.STATUS_UPDATE,
+            f"Phase changed to: {phase.value}",
+            requires_response=False,
+            metadata={"phase": phase.value},
+        )
 
     async def add_commit(self, sha: str) -> None:
         """Record a commit."""
         self.status.commits.append(sha)
-        self.status.updated_at = datetime.now()
+        self._pending_commits.append(sha)
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Commit: {sha[:7]}")
-        await self._persist()
+        self._request_write()
 
     async def set_pr(self, pr_number: int, pr_url: str) -> None:
         """Set PR information."""
         self.status.pr_number = pr_number
         self.status.pr_url = pr_url
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"PR created: #{pr_number} - {pr_url}")
-        await self._persist()
+        self._request_write()
 
     async def set_review_status(self, status: ReviewStatus) -> None:
         """Update review status."""
         self.status.review_status = status
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Review status: {status.value}")
-        await self._persist()
+        self._request_write()
 
     async def set_ci_status(self, status: CIStatus) -> None:
         """Update CI status."""
         self.status.ci_status = status
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"CI status: {status.value}")
-        await self._persist()
+        self._request_write()
 
     async def set_blocked(self, reason: str) -> None:
         """Mark as blocked - requires manager intervention."""
         self.status.phase = WorkerPhase.BLOCKED
+        self._phase_tag = f"[{self.status.phase.value}]"
         self.status.blocked_reason = reason
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.WARN, f"Blocked: {reason}")
-        await self._persist()
+        self._request_write()
         await self.notify_manager(NotificationType.BLOCKED, reason, requires_response=True)
 
     async def set_main_branch_verified(self, verified: bool) -> None:
         """Set whether main branch build was verified."""
         self.status.main_branch_verified = verified
-        self.status.updated_at = datetime.now()
-        await self._persist()
+        self.status.updated_at = self._now()
+        self._request_write()
 
     async def add_created_issue(self, issue_number: int) -> None:
         """Record created issue."""
         self.status.created_issues.append(issue_number)
-        self.status.updated_at = datetime.now()
+        self.status.updated_at = self._now()
         self.log(LogLevel.INFO, f"Created issue #{issue_number} for non-blocking feedback")
-        await self._persist()
+        self._request_write()
 
     def get_status(self) -> WorkerStatus:
-        """Get current status."""
-        return self.status.model_copy()
-
-    async def _persist(self) -> None:
-        """Persist status to file."""
-        self.status_file_path.write_text(
-            self.status.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+        """Get a copy of the current status, shared between calls until status changes."""
+        if self._snapshot is None:
+            # Entries are frozen models, so copying the containers is enough to keep
+            # later updates from showing through
+            status = self.status
+            self._snapshot = status.model_copy(
+                update={
+                    "logs": deque(status.logs, maxlen=status.logs.maxlen),
+                    "commits": list(status.commits),
+                    "created_issues": list(status.created_issues),
+                }
+            )
+        return self._snapshot
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group several status updates into a single write when the block exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._write_requested.set()
+
+    async def flush(self) -> None:
+        """Write pending status changes to disk now."""
+        async with self._write_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+
+            # Serialized on the event loop; the thread below only does file I/O
+            logs, self._pending_logs = self._pending_logs, []
+            commits, self._pending_commits = self._pending_commits, []
+            header = _dump_status(self.status, exclude=_APPENDED_FIELDS)
+            log_lines = b"".join(_dump_log_entry(entry) + b"\n" for entry in logs)
+            commit_lines = "".join(sha + "\n" for sha in commits).encode()
+            row = (
+                self.status.issue_number,
+                self.status.phase.value,
+                self.status.pr_number,
+                self.status.updated_at.isoformat(),
+                header,
+            )
+
+            try:
+                index_error = await asyncio.to_thread(
+                    self._write_files, header, log_lines, commit_lines, row
+                )
+            except OSError:
+                # Requeued for the next flush (at most MAX_STATUS_LOGS logs)
+                self._pending_logs[:0] = logs
+                del self._pending_logs[:-MAX_STATUS_LOGS]
+                self._pending_commits[:0] = commits
+                self._dirty = True
+                raise
+
+            if index_error is not None and self._db is not None:
+                # Only list-workers uses the index, and it falls back to reading status
+                # files; stop updating it rather than failing every write
+                self._db.close()
+                self._db = None
+                self.log(LogLevel.WARN, f"Status index disabled after an error: {index_error}")
+
+    def _write_files(
+        self, header: bytes, log_lines: bytes, commit_lines: bytes, row: tuple[Any, ...]
+    ) -> sqlite3.Error | None:
+        """Append new logs/commits, replace the status file, then update the status index.
+
+        Returns the index's error if updating it failed; the status files are written anyway.
+        """
+        append_bytes(self.logs_file_path, log_lines)
+        append_bytes(self.commits_file_path, commit_lines)
+        write_atomic(self.status_file_path, header)
+        if self._db is not None:
+            try:
+                with self._db:
+                    self._db.execute(_UPSERT_WORKER, row)
+            except sqlite3.Error as e:
+                return e
+        return None
+
+    def _request_write(self) -> None:
+        """Mark status as changed and wake the background writer (unless batching)."""
+        self._snapshot = None
+        self._dirty = True
+        if not self._batch_depth:
+            self._write_requested.set()
+
+    async def _write_loop(self) -> None:
+        """Write status changes in batches, backing off after failed writes."""
+        failures = 0
+        last_error: OSError | None = None
+        while True:
+            await self._write_requested.wait()
+            delay = min(WRITE_COALESCE_SECONDS * 2**failures, WRITE_RETRY_MAX_SECONDS)
+            # Cut short by close(), which writes whatever is pending itself
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), delay)
+            if self._closing.is_set():
+                return
+            self._write_requested.clear()
+            try:
+                await self.flush()
+            except OSError as e:
+                failures += 1
+                last_error = e
+                console.print(
+                    f"Failed to write status file (attempt {failures}): {e}",
+                    style=_LOG_STYLES[LogLevel.ERROR],
+                    markup=False,
+                    highlight=False,
+                )
+                self._write_requested.set()  # Retry after the backoff
+                continue
+            if failures:
+                self.log(
+                    LogLevel.WARN,
+                    f"Status file written after {failures} failed attempts: {last_error}",
+                )
+                failures = 0
+
+    def _now(self) -> datetime:
+        """Current time, refreshed at most every TIMESTAMP_REFRESH_SECONDS."""
+        now = time.monotonic()
+        if now - self._now_refreshed_at > TIMESTAMP_REFRESH_SECONDS:
+            self._now_cached = datetime.now()
+            self._now_refreshed_at = now
+        return self._now_cached
 
     async def notify_manager(
         self,
@@ -172,20 +461,12 @@ class StatusManager:
         )
 
         try:
-            # Read existing notifications
-            existing: list[dict[str, Any]] = []
-            if self.config.manager_notification_file.exists():
-                content = self.config.manager_notification_file.read_text(encoding="utf-8")
-                if content.strip():
-                    existing = json.loads(content)
-
-            # Append new notification
-            existing.append(notification.model_dump(mode="json"))
-
-            # Write back
-            self.config.manager_notification_file.write_text(
-                json.dumps(existing, indent=2, default=str),
-                encoding="utf-8",
+            # Notifications are JSON Lines: append one object per line. File I/O runs
+            # in a thread so it doesn't stall the event loop
+            await asyncio.to_thread(
+                _append_notification,
+                self.config.manager_notification_file,
+                _dump_notification(notification) + b"\n",
             )
             self.log(LogLevel.DEBUG, f"Notified manager: {notification_type.value}")
         except Exception as e:
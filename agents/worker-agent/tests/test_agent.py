@@ -0,0 +1,78 @@
+"""Tests for the worker agent's Claude session handling."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from claude_agent_sdk.types import AssistantMessage, Message, ResultMessage
+
+from worker_agent.agent import WorkerAgent
+from worker_agent.models import WorkerConfig
+
+
+class FakeClient:
+    """Stands in for ClaudeSDKClient, replaying a scripted response."""
+
+    def __init__(self, messages: list[Message]) -> None:
+        self.messages = messages
+        self.interrupted = False
+
+    async def query(self, prompt: str) -> None:
+        pass
+
+    async def interrupt(self) -> None:
+        self.interrupted = True
+
+    async def receive_response(self) -> AsyncIterator[Message]:
+        for message in self.messages:
+            yield message
+
+
+def turn(message_id: str, parent_tool_use_id: str | None = None) -> AssistantMessage:
+    return AssistantMessage(
+        content=[], model="claude", message_id=message_id, parent_tool_use_id=parent_tool_use_id
+    )
+
+
+RESULT = ResultMessage(
+    subtype="success", duration_ms=0, duration_api_ms=0, is_error=False, num_turns=0, session_id=""
+)
+
+
+def make_agent(client: FakeClient) -> WorkerAgent:
+    config = WorkerConfig(
+        github_token="token",
+        repo_owner="owner",
+        repo_name="repo",
+        base_dir=Path("/base"),
+        worktree_base_dir=Path("/worktrees"),
+        status_dir=Path("/status"),
+    )
+    agent = WorkerAgent(config, 42)
+    agent._claude = client  # type: ignore[assignment]
+    return agent
+
+
+async def test_run_claude_counts_turns_by_message_id() -> None:
+    """Messages sharing a turn's ID, and subagent messages, don't count as extra turns."""
+    client = FakeClient([turn("a"), turn("a"), turn("b"), turn("s", "tool-1"), RESULT])
+    agent = make_agent(client)
+
+    messages = [message async for message in agent._run_claude("prompt", max_turns=2)]
+
+    assert messages[-1] is RESULT
+    assert not client.interrupted
+
+
+async def test_run_claude_interrupts_past_turn_limit() -> None:
+    """A step that runs past its limit is interrupted and raises after draining."""
+    client = FakeClient([turn("a"), turn("b"), turn("c"), RESULT])
+    agent = make_agent(client)
+
+    seen: list[Message] = []
+    with pytest.raises(RuntimeError, match="limit of 2 turns"):
+        async for message in agent._run_claude("prompt", max_turns=2):
+            seen.append(message)
+
+    assert client.interrupted
+    assert len(seen) == 2  # The third turn and the result aren't passed on
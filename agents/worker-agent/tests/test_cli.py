@@ -0,0 +1,91 @@
+"""Tests for the worker agent CLI's status commands."""
+
+import sqlite3
+from pathlib import Path
+
+import orjson
+from typer.testing import CliRunner
+
+from worker_agent.cli import _read_log_tail, app
+from worker_agent.status_manager import _STATUS_DB_SCHEMA, _UPSERT_WORKER, _open_status_db
+
+runner = CliRunner()
+
+
+def write_status(status_dir: Path, issue_number: int, phase: str) -> None:
+    status = {"issue_number": issue_number, "phase": phase, "pr_number": None}
+    (status_dir / f"worker-{issue_number}.json").write_bytes(orjson.dumps(status))
+
+
+def index_worker(status_dir: Path, issue_number: int, phase: str, pr_number: int) -> None:
+    db = sqlite3.connect(status_dir / "status.db")
+    with db:
+        db.execute(_STATUS_DB_SCHEMA)
+        db.execute(_UPSERT_WORKER, (issue_number, phase, pr_number, "", b"{}"))
+    db.close()
+
+
+def test_list_workers_reads_files_missing_from_index(tmp_path: Path) -> None:
+    """Workers without an index row are listed from their status file."""
+    write_status(tmp_path, 1, "completed")
+    write_status(tmp_path, 2, "implementing")
+    index_worker(tmp_path, 1, "completed", 10)
+
+    result = runner.invoke(app, ["list-workers", "--status-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Issue #1: completed PR#10" in result.output  # From the index
+    assert "Issue #2: implementing" in result.output  # From the status file
+
+
+def test_list_workers_skips_rows_without_status_file(tmp_path: Path) -> None:
+    """Index rows for removed workers aren't listed."""
+    write_status(tmp_path, 1, "completed")
+    index_worker(tmp_path, 1, "completed", 10)
+    index_worker(tmp_path, 3, "failed", 30)
+
+    result = runner.invoke(app, ["list-workers", "--status-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Issue #1" in result.output
+    assert "Issue #3" not in result.output
+
+
+def test_open_status_db_prunes_removed_workers(tmp_path: Path) -> None:
+    """Opening the index drops rows whose status file is gone."""
+    write_status(tmp_path, 1, "completed")
+    index_worker(tmp_path, 1, "completed", 10)
+    index_worker(tmp_path, 3, "failed", 30)
+
+    db = _open_status_db(tmp_path / "status.db", "worker-{issue_number}.json")
+    issues = [row[0] for row in db.execute("SELECT issue_number FROM workers")]
+    db.close()
+
+    assert issues == [1]
+
+
+def test_status_shows_last_log_lines(tmp_path: Path) -> None:
+    """status prints the tail of the log journal, oldest first."""
+    write_status(tmp_path, 1, "implementing")
+    status = orjson.loads((tmp_path / "worker-1.json").read_bytes())
+    status.update(pid=1, branch="worker/issue-1", started_at="", updated_at="")
+    (tmp_path / "worker-1.json").write_bytes(orjson.dumps(status))
+    entries = [orjson.dumps({"level": "info", "message": f"step {i}"}) for i in range(15)]
+    (tmp_path / "worker-1.logs.jsonl").write_bytes(b"\n".join(entries) + b"\n")
+
+    result = runner.invoke(app, ["status", "1", "--status-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    shown = [line.strip() for line in result.output.splitlines() if "step" in line]
+    assert shown == [f"[info] step {i}" for i in range(5, 15)]
+
+
+def test_read_log_tail_handles_edges(tmp_path: Path) -> None:
+    """Empty files, blank lines and a missing final newline don't affect the tail."""
+    path = tmp_path / "worker-1.logs.jsonl"
+    path.write_bytes(b"")
+    assert _read_log_tail(path, 3) == []
+
+    path.write_bytes(b'{"n": 1}\n\n{"n": 2}\n{"n": 3}')
+    assert _read_log_tail(path, 2) == [{"n": 2}, {"n": 3}]
+    assert _read_log_tail(path, 10) == [{"n": 1}, {"n": 2}, {"n": 3}]
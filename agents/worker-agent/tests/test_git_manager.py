@@ -0,0 +1,47 @@
+"""Tests for running git processes from the worker and shared git helpers."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from worker_shared import git_ops as git_ops_module
+from worker_shared.git_ops import GitOperations
+
+from worker_agent import git_manager as git_manager_module
+from worker_agent.git_manager import GitManager
+from worker_agent.models import WorkerConfig
+from worker_agent.status_manager import StatusManager
+
+
+def make_status_manager(tmp_path: Path) -> StatusManager:
+    config = WorkerConfig(
+        github_token="token",
+        repo_owner="owner",
+        repo_name="repo",
+        base_dir=tmp_path,
+        worktree_base_dir=tmp_path,
+        status_dir=tmp_path,
+    )
+    return StatusManager(config, 42, "worker/issue-42", str(tmp_path / "issue-42"))
+
+
+@pytest.mark.parametrize("module", [git_manager_module, git_ops_module])
+def test_process_slots_work_across_event_loops(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, module: object
+) -> None:
+    """Processes can contend for slots in one event loop after another has used them."""
+    monkeypatch.setattr(module.os, "cpu_count", lambda: 1)  # type: ignore[attr-defined]
+    status_manager = make_status_manager(tmp_path)
+    git = (
+        GitManager(tmp_path, tmp_path, 42, status_manager)
+        if module is git_manager_module
+        else GitOperations(tmp_path, tmp_path, 42, status_manager)
+    )
+
+    async def run_concurrently() -> list[str]:
+        return await asyncio.gather(
+            git._exec("echo", "one", cwd=tmp_path), git._exec("echo", "two", cwd=tmp_path)
+        )
+
+    assert asyncio.run(run_concurrently()) == ["one\n", "two\n"]
+    assert asyncio.run(run_concurrently()) == ["one\n", "two\n"]
@@ -85,4 +85,5 @@ def test_worker_config_defaults() -> None:
     assert config.auto_merge is False
     assert config.max_retries == 3
     assert config.coverage_threshold == 70
+    assert config.min_log_level == LogLevel.INFO
     assert config.manager_notification_file is None
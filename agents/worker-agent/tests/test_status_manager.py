@@ -0,0 +1,185 @@
+"""Tests for the worker status manager's background writer."""
+
+import asyncio
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import orjson
+import pytest
+
+from worker_agent import status_manager as status_module
+from worker_agent.models import LogLevel, WorkerConfig, WorkerPhase
+from worker_agent.status_manager import StatusManager
+
+
+@pytest.fixture(autouse=True)
+def fast_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shorten the coalescing window so tests don't wait on it."""
+    monkeypatch.setattr(status_module, "WRITE_COALESCE_SECONDS", 0.01)
+
+
+def make_manager(status_dir: Path) -> StatusManager:
+    config = WorkerConfig(
+        github_token="token",
+        repo_owner="owner",
+        repo_name="repo",
+        base_dir=Path("/base"),
+        worktree_base_dir=Path("/worktrees"),
+        status_dir=status_dir,
+    )
+    return StatusManager(config, 42, "worker/issue-42", "/worktrees/issue-42")
+
+
+async def test_close_waits_for_write_in_progress(tmp_path: Path) -> None:
+    """close() lets an in-flight write finish, then writes the latest status."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+
+    write_files = manager._write_files
+    started = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def slow_write(*args: object) -> None:
+        loop.call_soon_threadsafe(started.set)
+        time.sleep(0.1)
+        write_files(*args)  # type: ignore[arg-type]
+
+    manager._write_files = slow_write  # type: ignore[method-assign]
+    await manager.set_phase(WorkerPhase.IMPLEMENTING)
+    await started.wait()
+    await manager.set_phase(WorkerPhase.VALIDATING)
+    await manager.close()
+
+    status = orjson.loads((tmp_path / "worker-42.json").read_bytes())
+    assert status["phase"] == WorkerPhase.VALIDATING.value
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+async def test_failed_writes_back_off_without_logging(tmp_path: Path) -> None:
+    """A failing disk is retried with backoff, and the error is logged once writes recover."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+
+    write_files = manager._write_files
+    attempts = 0
+
+    def failing_write(*args: object) -> None:
+        nonlocal attempts
+        attempts += 1
+        raise OSError("disk full")
+
+    manager._write_files = failing_write  # type: ignore[method-assign]
+    manager.log(LogLevel.INFO, "before failure")
+    await asyncio.sleep(0.3)
+
+    # 0.01s doubling: about 5 attempts in 0.3s, rather than one every 0.01s
+    assert 1 < attempts < 8
+    assert not any("Failed to write" in entry.message for entry in manager.status.logs)
+
+    manager._write_files = write_files  # type: ignore[method-assign]
+    await asyncio.sleep(0.7)  # Longer than the current backoff
+    await manager.close()
+
+    logs = (tmp_path / "worker-42.logs.jsonl").read_bytes().splitlines()
+    messages = [orjson.loads(line)["message"] for line in logs]
+    assert "before failure" in messages
+    assert any(message.endswith("failed attempts: disk full") for message in messages)
+
+
+async def test_get_status_is_independent_of_live_status(tmp_path: Path) -> None:
+    """The snapshot doesn't see later updates, and changing it doesn't change the status."""
+    manager = make_manager(tmp_path)
+    snapshot = manager.get_status()
+    assert manager.get_status() is snapshot  # Reused until the status changes
+
+    manager.log(LogLevel.INFO, "after snapshot")
+    snapshot.commits.append("abc1234")
+
+    assert not any(entry.message == "after snapshot" for entry in snapshot.logs)
+    assert manager.status.commits == []
+    assert manager.get_status() is not snapshot
+
+
+async def test_burst_of_updates_is_written_once(tmp_path: Path) -> None:
+    """Updates made within the coalescing window share one write."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+    await manager.flush()  # Write the startup log line before counting
+
+    write_files = manager._write_files
+    writes = 0
+
+    def counting_write(*args: object) -> None:
+        nonlocal writes
+        writes += 1
+        write_files(*args)  # type: ignore[arg-type]
+
+    manager._write_files = counting_write  # type: ignore[method-assign]
+    await manager.set_phase(WorkerPhase.IMPLEMENTING)
+    await manager.add_commit("abc1234")
+    manager.log(LogLevel.INFO, "working")
+    await asyncio.sleep(0.05)
+    await manager.close()  # Waits for the write; nothing is left for it to write
+
+    assert writes == 1
+    status = orjson.loads((tmp_path / "worker-42.json").read_bytes())
+    assert status["phase"] == WorkerPhase.IMPLEMENTING.value
+
+
+async def test_commits_are_journaled_outside_status_file(tmp_path: Path) -> None:
+    """Commits are appended one per line to the journal, not rewritten in the status file."""
+    (tmp_path / "worker-42.commits.log").write_bytes(b"stale\n")  # From an earlier run
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+
+    await manager.add_commit("abc1234")
+    await manager.flush()
+    await manager.add_commit("def5678")
+    await manager.close()
+
+    journal = (tmp_path / "worker-42.commits.log").read_bytes()
+    assert journal == b"abc1234\ndef5678\n"
+    assert "commits" not in orjson.loads((tmp_path / "worker-42.json").read_bytes())
+    assert manager.status.commits == ["abc1234", "def5678"]
+
+
+async def test_status_index_row_tracks_latest_status(tmp_path: Path) -> None:
+    """Each write replaces the worker's index row with its current phase and PR."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+    await manager.set_pr(7, "https://github.com/owner/repo/pull/7")
+    await manager.set_phase(WorkerPhase.AWAITING_REVIEW)
+    await manager.close()
+
+    db = sqlite3.connect(tmp_path / "status.db")
+    rows = db.execute("SELECT issue_number, phase, pr_number, json FROM workers").fetchall()
+    db.close()
+
+    assert [row[:3] for row in rows] == [(42, WorkerPhase.AWAITING_REVIEW.value, 7)]
+    assert rows[0][3] == (tmp_path / "worker-42.json").read_bytes()
+
+
+async def test_broken_status_index_does_not_block_status_files(tmp_path: Path) -> None:
+    """An index error is logged once and the status files keep being written."""
+    manager = make_manager(tmp_path)
+    await manager.initialize()
+    db = sqlite3.connect(tmp_path / "status.db")
+    db.execute("DROP TABLE workers")
+    db.close()
+
+    await manager.set_phase(WorkerPhase.IMPLEMENTING)
+    await manager.flush()
+    await manager.set_phase(WorkerPhase.VALIDATING)
+    await manager.close()
+
+    status = orjson.loads((tmp_path / "worker-42.json").read_bytes())
+    assert status["phase"] == WorkerPhase.VALIDATING.value
+    logs = (tmp_path / "worker-42.logs.jsonl").read_bytes().splitlines()
+    warnings = [
+        entry["message"]
+        for entry in map(orjson.loads, logs)
+        if entry["message"].startswith("Status index disabled")
+    ]
+    assert warnings == ["Status index disabled after an error: no such table: workers"]
@@ -0,0 +1,88 @@
+"""Tests for the TTL cache used in front of GitHub lookups."""
+
+import asyncio
+import gc
+import importlib
+from types import SimpleNamespace
+
+import pytest
+from worker_shared import ttl_cache
+
+# The package exports the decorator under the module's name
+ttl_module = importlib.import_module("worker_shared.ttl_cache")
+
+
+class Lookup:
+    """Counts calls to a cached method."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @ttl_cache(60)
+    async def get(self, key: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"{key}-{self.calls}"
+
+
+async def test_hit_reuses_result() -> None:
+    lookup = Lookup()
+    assert await lookup.get("a") == "a-1"
+    assert await lookup.get("a") == "a-1"
+    assert await lookup.get("b") == "b-2"
+    assert lookup.calls == 2
+
+
+async def test_expired_result_is_refetched(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookup = Lookup()
+    await lookup.get("a")
+
+    # Patch the cache's clock only; the event loop shares time.monotonic
+    later = ttl_module.time.monotonic() + 61
+    monkeypatch.setattr(ttl_module, "time", SimpleNamespace(monotonic=lambda: later))
+    assert await lookup.get("a") == "a-2"
+
+
+async def test_concurrent_calls_share_one_fill() -> None:
+    lookup = Lookup()
+    results = await asyncio.gather(*(lookup.get("a") for _ in range(5)))
+    assert results == ["a-1"] * 5
+    assert lookup.calls == 1
+
+
+async def test_failed_fill_is_not_cached() -> None:
+    attempts = 0
+
+    @ttl_cache(60)
+    async def flaky() -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("first call fails")
+        return attempts
+
+    with pytest.raises(ValueError):
+        await flaky()
+    assert await flaky() == 2
+
+
+async def test_invalidate_on_bound_method() -> None:
+    lookup = Lookup()
+    await lookup.get("a")
+    lookup.get.invalidate("a")
+    assert await lookup.get("a") == "a-2"
+
+
+async def test_instances_have_separate_caches_released_with_them() -> None:
+    gc.collect()  # Release instances from earlier tests
+    stores = Lookup.get._instance_stores
+    before = len(stores)
+
+    first, second = Lookup(), Lookup()
+    assert await first.get("a") == "a-1"
+    assert await second.get("a") == "a-1"
+    assert len(stores) == before + 2
+
+    del first
+    gc.collect()
+    assert len(stores) == before + 1
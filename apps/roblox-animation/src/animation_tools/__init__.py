@@ -9,6 +9,7 @@ Tools:
 - create_animation: Generate/modify Blender animation from a prompt
 - render_frames: Render animation frames to images
 - analyze_animation: Analyze frames with Gemini, returns done/needs_work verdict
+- BlenderSession: Keep one Blender process alive across create/render calls
 
 Usage:
     from animation_tools import create_animation, render_frames, analyze_animation
@@ -24,9 +25,10 @@ Usage:
         previous_feedback = result["suggestions"]
 """
 
+from .blender_session import BlenderSession, ScriptResult
 from .create_animation import create_animation, AnimationResult
 from .render_frames import render_frames, RenderResult
-from .analyze_animation import analyze_animation, AnimationAnalysisResult
+from .analyze_animation import analyze_animation, load_frame_part, AnimationAnalysisResult
 from .orchestrator import (
     run_animation_workflow,
     AnimationWorkflowConfig,
@@ -35,11 +37,14 @@ from .orchestrator import (
 )
 
 __all__ = [
+    "BlenderSession",
+    "ScriptResult",
     "create_animation",
     "AnimationResult",
     "render_frames",
     "RenderResult",
     "analyze_animation",
+    "load_frame_part",
     "AnimationAnalysisResult",
     "run_animation_workflow",
     "AnimationWorkflowConfig",
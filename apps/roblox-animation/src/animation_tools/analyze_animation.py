@@ -10,13 +10,16 @@ This tool is responsible for:
 The verdict is authoritative - Claude should not second-guess it.
 """
 
+import io
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
 from google import genai
 from google.genai import types
+from PIL import Image
 
 
 @dataclass
@@ -110,11 +113,47 @@ Respond in this exact JSON format:
 """
 
 
+MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+
+def load_frame_part(
+    frame_path: Path | str,
+    max_size: tuple[int, int] | None = None,
+) -> types.Part:
+    """
+    Load a frame image as a Gemini content part.
+
+    Safe to call from worker threads, e.g. while later frames are still rendering.
+
+    Args:
+        frame_path: Path to the frame image
+        max_size: Optional (width, height) box to downscale the frame into,
+            keeping its aspect ratio. Smaller frames mean fewer bytes uploaded
+            and fewer image tokens for Gemini. The file on disk is unchanged.
+    """
+    frame_path = Path(frame_path)
+    if max_size is None:
+        mime_type = MIME_TYPES.get(frame_path.suffix.lower(), "image/png")
+        return types.Part.from_bytes(data=frame_path.read_bytes(), mime_type=mime_type)
+
+    with Image.open(frame_path) as image:
+        image.thumbnail(max_size, Image.Resampling.BILINEAR)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+    return types.Part.from_bytes(data=buffer.getvalue(), mime_type="image/png")
+
+
 def analyze_animation(
     frame_paths: list[Path] | list[str],
     requirements: str,
     model: str = "gemini-2.0-flash",
     quality_threshold: int = 85,
+    frame_parts: Mapping[Path, types.Part] | None = None,
+    max_frame_size: tuple[int, int] | None = None,
 ) -> AnimationAnalysisResult:
     """
     Analyze animation frames and return a verdict.
@@ -124,6 +163,10 @@ def analyze_animation(
         requirements: Description of what the animation should achieve
         model: Gemini model to use
         quality_threshold: Minimum score for "done" verdict (default 85)
+        frame_parts: Optional frames already loaded with load_frame_part, keyed
+            by path; any frame not in the mapping is loaded here
+        max_frame_size: Optional (width, height) box frames loaded here are
+            downscaled into (see load_frame_part)
 
     Returns:
         AnimationAnalysisResult with verdict, score, issues, and suggestions
@@ -149,21 +192,16 @@ def analyze_animation(
     # Build parts with images
     parts: list[types.Part | str] = [prompt]
 
+    preloaded = frame_parts or {}
     for frame_path in frames:
-        if not frame_path.exists():
-            continue
-
-        image_bytes = frame_path.read_bytes()
-        suffix = frame_path.suffix.lower()
-        mime_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-        }
-        mime_type = mime_types.get(suffix, "image/png")
+        part = preloaded.get(frame_path)
+        if part is None:
+            if not frame_path.exists():
+                continue
+            part = load_frame_part(frame_path, max_size=max_frame_size)
 
         parts.append(f"\n--- {frame_path.name} ---")
-        parts.append(types.Part.from_bytes(data=image_bytes, mime_type=mime_type))
+        parts.append(part)
 
     # Call Gemini
     response = client.models.generate_content(
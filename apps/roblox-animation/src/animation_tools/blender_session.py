@@ -0,0 +1,224 @@
+"""
+Long-lived headless Blender process for running scripts.
+
+Starting Blender (loading bpy, add-ons and render kernels) takes several
+seconds. A BlenderSession pays that cost once and then runs every script in
+the same process, which matters when an agent creates, renders and exports
+animations over many iterations.
+
+Protocol: each request is one JSON line on Blender's stdin with the script
+source and an optional .blend file to open first (otherwise the startup scene
+is loaded, as for a fresh `blender --background`). The server replies with a
+single line starting with RESPONSE_PREFIX; everything Blender prints before
+that line is the script's output.
+"""
+
+import json
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+# Marks the server's reply line on stdout
+RESPONSE_PREFIX = "@@blender-session@@ "
+
+# Max lines of Blender output kept in ScriptResult.output
+OUTPUT_TAIL_LINES = 50
+
+
+SESSION_SERVER_SCRIPT = '''"""
+Blender session server - runs scripts sent as JSON lines on stdin.
+"""
+
+import json
+import sys
+import traceback
+
+import bpy
+
+for line in sys.stdin:
+    request = json.loads(line)
+    try:
+        if request.get("blend_file"):
+            bpy.ops.wm.open_mainfile(filepath=request["blend_file"])
+        else:
+            bpy.ops.wm.read_homefile()
+        code = compile(request["script"], "<blender-session>", "exec")
+        exec(code, {{"__name__": "__main__"}})
+        response = {{"ok": True, "error": None}}
+    except (Exception, SystemExit):
+        response = {{"ok": False, "error": traceback.format_exc()}}
+    sys.stdout.flush()
+    print("{response_prefix}" + json.dumps(response), flush=True)
+'''
+
+
+@dataclass
+class ScriptResult:
+    """Result of running a script in a Blender session."""
+
+    success: bool
+    output: str  # Tail of Blender's combined stdout/stderr while the script ran
+    error: str | None  # Traceback if the script raised
+
+
+class BlenderSession:
+    """
+    A headless Blender process that stays alive between scripts.
+
+    The process is started on first use and restarted automatically if it
+    crashes or times out. Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, blender: str = "blender") -> None:
+        self.blender = blender
+        self._proc: subprocess.Popen[str] | None = None
+        self._server_script: Path | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "BlenderSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def run_script(
+        self,
+        script: str,
+        blend_file: Path | str | None = None,
+        timeout: float = 120,
+        on_output: Callable[[str], None] | None = None,
+    ) -> ScriptResult:
+        """
+        Run a Blender Python script in the session.
+
+        Args:
+            script: Python source to execute inside Blender
+            blend_file: Optional .blend file to open before running the script;
+                if omitted the startup scene is loaded
+            timeout: Seconds before Blender is killed (the session restarts on
+                the next call)
+            on_output: Optional callback for each line Blender prints while
+                the script runs
+
+        Returns:
+            ScriptResult with success flag, output tail and any traceback
+
+        Raises:
+            subprocess.TimeoutExpired: If the script runs longer than timeout
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            assert proc.stdin is not None and proc.stdout is not None
+
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, _kill)
+            timer.start()
+            output: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+            response: dict[str, object] | None = None
+            try:
+                request = {"script": script, "blend_file": str(blend_file) if blend_file else None}
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        break  # Blender exited
+                    if line.startswith(RESPONSE_PREFIX):
+                        response = json.loads(line[len(RESPONSE_PREFIX) :])
+                        break
+                    output.append(line)
+                    if on_output is not None:
+                        on_output(line)
+            except BrokenPipeError:
+                pass  # Blender already exited
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                self._discard()
+                raise subprocess.TimeoutExpired([self.blender], timeout)
+
+            if response is None:
+                self._discard()
+                return ScriptResult(
+                    success=False,
+                    output="".join(output),
+                    error="Blender exited unexpectedly",
+                )
+
+            error = response.get("error")
+            return ScriptResult(
+                success=bool(response.get("ok")),
+                output="".join(output),
+                error=str(error) if error else None,
+            )
+
+    def close(self) -> None:
+        """Shut down the Blender process."""
+        with self._lock:
+            proc = self._proc
+            self._proc = None
+            if proc is not None:
+                try:
+                    assert proc.stdin is not None
+                    proc.stdin.close()  # Server loop ends on EOF and Blender exits
+                    proc.wait(timeout=10)
+                except (OSError, subprocess.TimeoutExpired):
+                    proc.kill()
+                    proc.wait()
+                if proc.stdout is not None:
+                    proc.stdout.close()
+            if self._server_script is not None:
+                self._server_script.unlink(missing_ok=True)
+                self._server_script = None
+
+    def _ensure_started(self) -> "subprocess.Popen[str]":
+        """Start Blender if it isn't running."""
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                return self._proc
+            self._discard()  # Exited between calls; release its pipes before replacing it
+
+        if self._server_script is None:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+                f.write(SESSION_SERVER_SCRIPT.format(response_prefix=RESPONSE_PREFIX))
+                self._server_script = Path(f.name)
+
+        self._proc = subprocess.Popen(
+            [self.blender, "--background", "--python", str(self._server_script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        return self._proc
+
+    def _discard(self) -> None:
+        """Kill the current Blender process so the next call starts a fresh one."""
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc.wait()
+            for stream in (self._proc.stdin, self._proc.stdout):
+                if stream is not None:
+                    try:
+                        stream.close()
+                    except OSError:
+                        pass
+            self._proc = None
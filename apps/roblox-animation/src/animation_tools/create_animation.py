@@ -11,6 +11,8 @@ import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
+from .blender_session import BlenderSession
+
 
 @dataclass
 class AnimationResult:
@@ -60,6 +62,7 @@ def create_animation(
     animation_code: str | None = None,
     fps: int = 30,
     duration: float = 2.0,
+    session: BlenderSession | None = None,
 ) -> AnimationResult:
     """
     Create a Blender animation from a prompt.
@@ -71,6 +74,8 @@ def create_animation(
         animation_code: Optional pre-written Blender Python code for animation
         fps: Frames per second
         duration: Animation duration in seconds
+        session: Optional running Blender session to execute the script in,
+            instead of starting a new Blender process
 
     Returns:
         AnimationResult with the path to the created .blend file
@@ -97,6 +102,20 @@ def create_animation(
         output_path=str(output_path).replace("\\", "/"),
     )
 
+    if session is not None:
+        try:
+            session_result = session.run_script(script_content, timeout=120)
+        except subprocess.TimeoutExpired:
+            return _timed_out_result(output_path, script_content)
+        if not session_result.success:
+            return AnimationResult(
+                blend_file=output_path,
+                success=False,
+                message=f"Blender failed: {session_result.error or session_result.output}",
+                script_used=script_content,
+            )
+        return _saved_result(output_path, script_content)
+
     # Write script to temp file
     with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
         f.write(script_content)
@@ -119,31 +138,41 @@ def create_animation(
                 script_used=script_content,
             )
 
-        if not output_path.exists():
-            return AnimationResult(
-                blend_file=output_path,
-                success=False,
-                message="Blender completed but no file was created",
-                script_used=script_content,
-            )
-
-        return AnimationResult(
-            blend_file=output_path,
-            success=True,
-            message=f"Animation created: {output_path}",
-            script_used=script_content,
-        )
+        return _saved_result(output_path, script_content)
 
     except subprocess.TimeoutExpired:
+        return _timed_out_result(output_path, script_content)
+    finally:
+        # Clean up temp script
+        Path(script_path).unlink(missing_ok=True)
+
+
+def _saved_result(output_path: Path, script_content: str) -> AnimationResult:
+    """Build the result after Blender ran the script, checking the file was saved."""
+    if not output_path.exists():
         return AnimationResult(
             blend_file=output_path,
             success=False,
-            message="Blender timed out after 120 seconds",
+            message="Blender completed but no file was created",
             script_used=script_content,
         )
-    finally:
-        # Clean up temp script
-        Path(script_path).unlink(missing_ok=True)
+
+    return AnimationResult(
+        blend_file=output_path,
+        success=True,
+        message=f"Animation created: {output_path}",
+        script_used=script_content,
+    )
+
+
+def _timed_out_result(output_path: Path, script_content: str) -> AnimationResult:
+    """Build the result for a Blender run that hit the timeout."""
+    return AnimationResult(
+        blend_file=output_path,
+        success=False,
+        message="Blender timed out after 120 seconds",
+        script_used=script_content,
+    )
 
 
 def _generate_placeholder_animation(prompt: str) -> str:
@@ -6,9 +6,13 @@ This tool renders each frame of an animation to PNG files for analysis.
 
 import subprocess
 import tempfile
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
+from .blender_session import BlenderSession
+
 
 @dataclass
 class RenderResult:
@@ -20,6 +24,12 @@ class RenderResult:
     message: str
 
 
+# Printed by the render script after each frame is written, followed by the file path
+FRAME_WRITTEN_PREFIX = "Frame written: "
+
+# Max lines of Blender output kept in failure messages
+ERROR_OUTPUT_LINES = 50
+
 RENDER_SCRIPT = '''"""
 Render animation frames to PNG files.
 """
@@ -65,6 +75,7 @@ for frame in range(frame_start, frame_end + 1):
 
     # Render
     bpy.ops.render.render(write_still=True)
+    print(f"{frame_written_prefix}{{scene.render.filepath}}", flush=True)
 
     # Progress
     progress = (frame - frame_start + 1) / total_frames * 100
@@ -79,6 +90,8 @@ def render_frames(
     output_dir: Path | str,
     resolution: tuple[int, int] = (1920, 1080),
     samples: int = 16,
+    on_frame: Callable[[Path], None] | None = None,
+    session: BlenderSession | None = None,
 ) -> RenderResult:
     """
     Render animation frames from a Blender file.
@@ -88,6 +101,11 @@ def render_frames(
         output_dir: Directory to save rendered frames
         resolution: (width, height) of rendered frames
         samples: Render samples (higher = better quality, slower)
+        on_frame: Optional callback invoked with each frame's path as soon as
+            Blender has written it, so callers can process frames while the
+            rest of the animation is still rendering
+        session: Optional running Blender session to render in, instead of
+            starting a new Blender process
 
     Returns:
         RenderResult with paths to all rendered frames
@@ -110,31 +128,37 @@ def render_frames(
         resolution_x=resolution[0],
         resolution_y=resolution[1],
         samples=samples,
+        frame_written_prefix=FRAME_WRITTEN_PREFIX,
     )
 
-    # Write script to temp file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(script_content)
-        script_path = f.name
-
     try:
-        # Run Blender in headless mode
-        result = subprocess.run(
-            ["blender", "--background", str(blend_file), "--python", script_path],
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout for rendering
-        )
+        if session is not None:
+            session_result = session.run_script(
+                script_content,
+                blend_file=blend_file,
+                timeout=600,  # 10 minute timeout for rendering
+                on_output=_frame_reporter(on_frame),
+            )
+            returncode = 0 if session_result.success else 1
+            output = session_result.error or session_result.output
+        else:
+            # Run Blender in headless mode, streaming its output to report frames as they land
+            returncode, output = _run_blender(
+                script_content,
+                blend_file,
+                timeout=600,  # 10 minute timeout for rendering
+                on_frame=on_frame,
+            )
 
         # Collect rendered frames
         frame_paths = sorted(output_dir.glob("frame_*.png"))
 
-        if result.returncode != 0 and not frame_paths:
+        if returncode != 0 and not frame_paths:
             return RenderResult(
                 frames_dir=output_dir,
                 frame_paths=[],
                 success=False,
-                message=f"Blender render failed: {result.stderr}",
+                message=f"Blender render failed: {output}",
             )
 
         if not frame_paths:
@@ -161,11 +185,88 @@ def render_frames(
             success=len(frame_paths) > 0,
             message=f"Render timed out. {len(frame_paths)} frames completed.",
         )
+
+
+def _run_blender(
+    script_content: str,
+    blend_file: Path,
+    timeout: float,
+    on_frame: Callable[[Path], None] | None,
+) -> tuple[int, str]:
+    """
+    Run the render script in a new Blender process, calling on_frame for every
+    frame it reports as written.
+
+    Returns (returncode, tail of combined stdout/stderr).
+    Raises subprocess.TimeoutExpired if Blender runs longer than timeout.
+    """
+    # Write script to temp file
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+        f.write(script_content)
+        script_path = f.name
+
+    command = ["blender", "--background", str(blend_file), "--python", script_path]
+    try:
+        return _stream_blender(command, timeout, on_frame)
     finally:
         # Clean up temp script
         Path(script_path).unlink(missing_ok=True)
 
 
+def _stream_blender(
+    command: list[str],
+    timeout: float,
+    on_frame: Callable[[Path], None] | None,
+) -> tuple[int, str]:
+    """Run a Blender command, streaming its output to on_frame."""
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    report_frame = _frame_reporter(on_frame)
+    lines: list[str] = []
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            lines.append(line)
+            if report_frame is not None:
+                report_frame(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    return returncode, "".join(lines[-ERROR_OUTPUT_LINES:])
+
+
+def _frame_reporter(
+    on_frame: Callable[[Path], None] | None,
+) -> Callable[[str], None] | None:
+    """Wrap on_frame as a Blender output line handler that picks out written frames."""
+    if on_frame is None:
+        return None
+
+    def _on_line(line: str) -> None:
+        if line.startswith(FRAME_WRITTEN_PREFIX):
+            on_frame(Path(line[len(FRAME_WRITTEN_PREFIX) :].strip()))
+
+    return _on_line
+
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,129 @@
+"""Tests for animation tools."""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Stands in for Blender: runs the session server script against a stub bpy
+FAKE_BLENDER = """#!{python}
+import runpy
+import sys
+import types
+
+wm = types.SimpleNamespace(
+    open_mainfile=lambda filepath: print("opened", filepath),
+    read_homefile=lambda: print("startup scene"),
+)
+sys.modules["bpy"] = types.SimpleNamespace(ops=types.SimpleNamespace(wm=wm))
+runpy.run_path(sys.argv[sys.argv.index("--python") + 1], run_name="__main__")
+"""
+
+
+@pytest.fixture
+def fake_blender(tmp_path: Path) -> str:
+    """Path to an executable that behaves like `blender --background --python`."""
+    path = tmp_path / "blender"
+    path.write_text(FAKE_BLENDER.format(python=sys.executable))
+    path.chmod(0o755)
+    return str(path)
+
+
+class TestLoadFramePart:
+    """Tests for loading frames for Gemini analysis."""
+
+    def test_full_size_frame_is_sent_unchanged(self, tmp_path: Path) -> None:
+        """Test frame bytes are passed through when no max size is given."""
+        from animation_tools.analyze_animation import load_frame_part
+
+        frame = tmp_path / "frame_0001.png"
+        Image.new("RGB", (1280, 720)).save(frame)
+
+        part = load_frame_part(frame)
+
+        assert part.inline_data is not None
+        assert part.inline_data.data == frame.read_bytes()
+        assert part.inline_data.mime_type == "image/png"
+
+    def test_frame_is_downscaled_keeping_aspect_ratio(self, tmp_path: Path) -> None:
+        """Test frames are shrunk to fit the max size box."""
+        from animation_tools.analyze_animation import load_frame_part
+
+        frame = tmp_path / "frame_0001.png"
+        Image.new("RGB", (1280, 720)).save(frame)
+
+        part = load_frame_part(frame, max_size=(224, 224))
+
+        assert part.inline_data is not None
+        assert part.inline_data.data is not None
+        with Image.open(io.BytesIO(part.inline_data.data)) as image:
+            assert image.size == (224, 126)
+        # Original frame on disk is untouched
+        with Image.open(frame) as original:
+            assert original.size == (1280, 720)
+
+
+class TestBlenderSession:
+    """Tests for running scripts in a long-lived Blender process."""
+
+    def test_scripts_share_one_process(self, fake_blender: str, tmp_path: Path) -> None:
+        """Test each script gets a fresh scene but Blender is started only once."""
+        from animation_tools import BlenderSession
+
+        lines: list[str] = []
+        with BlenderSession(fake_blender) as session:
+            first = session.run_script("import os; print(os.getpid())", on_output=lines.append)
+            second = session.run_script(
+                "import os; print(os.getpid())", blend_file=tmp_path / "a.blend"
+            )
+
+        assert first.success and first.error is None
+        assert first.output.splitlines()[0] == "startup scene"
+        assert second.output.splitlines()[0] == f"opened {tmp_path / 'a.blend'}"
+        assert first.output.splitlines()[1] == second.output.splitlines()[1]
+        assert lines == first.output.splitlines(keepends=True)
+
+    def test_script_error_keeps_session(self, fake_blender: str) -> None:
+        """Test a failing script reports its traceback without restarting Blender."""
+        from animation_tools import BlenderSession
+
+        with BlenderSession(fake_blender) as session:
+            failed = session.run_script("import os; print(os.getpid()); raise ValueError('bad')")
+            after = session.run_script("import os; print(os.getpid())")
+
+        assert not failed.success
+        assert failed.error is not None and "ValueError: bad" in failed.error
+        assert after.success
+        assert failed.output.splitlines()[1] == after.output.splitlines()[1]
+
+    def test_crash_and_timeout_restart_blender(self, fake_blender: str) -> None:
+        """Test Blender is restarted after it exits or is killed for running too long."""
+        from animation_tools import BlenderSession
+
+        with BlenderSession(fake_blender) as session:
+            crashed = session.run_script("import os; print(os.getpid(), flush=True); os._exit(1)")
+            with pytest.raises(subprocess.TimeoutExpired):
+                session.run_script("import time; time.sleep(30)", timeout=0.5)
+            after = session.run_script("import os; print(os.getpid())")
+
+        assert not crashed.success
+        assert crashed.error == "Blender exited unexpectedly"
+        assert after.success
+        assert crashed.output.splitlines()[1] != after.output.splitlines()[1]
+
+    def test_close_removes_server_script(self, fake_blender: str) -> None:
+        """Test close() stops Blender and deletes the temporary server script."""
+        from animation_tools import BlenderSession
+
+        session = BlenderSession(fake_blender)
+        assert session.run_script("pass").success
+        server_script = session._server_script
+        assert server_script is not None and server_script.exists()
+
+        session.close()
+
+        assert not server_script.exists()
+        assert session._proc is None